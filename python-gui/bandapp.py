@@ -1,2476 +1,2982 @@
-import sys
-import os
-import csv
-import sqlite3
-from datetime import date
-
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction
-from PySide6.QtWidgets import (
-    QApplication, QWidget, QMainWindow, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox,
-    QTableWidget, QTableWidgetItem, QMessageBox, QGroupBox, QFormLayout,
-    QTabWidget, QFileDialog, QHeaderView, QInputDialog, QCheckBox,
-    QSplitter, QToolButton, QButtonGroup, QDialog, QAbstractItemView,
-    QGraphicsDropShadowEffect, QCompleter, QStyle, QFrame
-)
-
-DB_PATH = "band.db"
-
-SECTIONS = ["WOODWIND", "BRASS", "PERCUSSION", "FLAG CORP", "DRUM MAJOR", "OTHER"]
-CLASSIFICATIONS = ["", "Freshman", "Sophomore", "Junior", "Senior", "Graduate"]
-SHIRT_SIZES = ["", "XS", "S", "M", "L", "XL", "XXL", "XXXL"]
-SHOE_SIZES = [""] + [str(x) for x in [
-    5, 5.5, 6, 6.5, 7, 7.5, 8, 8.5, 9, 9.5, 10, 10.5, 11, 11.5, 12, 12.5, 13, 13.5, 14, 14.5, 15
-]]
-
-INSTRUMENT_CATALOG = [
-    ("PICCOLO", "WOODWIND"),
-    ("FLUTE", "WOODWIND"),
-    ("CLARINET", "WOODWIND"),
-    ("ALTO SAXOPHONE", "WOODWIND"),
-    ("TENOR SAXOPHONE", "WOODWIND"),
-    ("BARITONE SAXOPHONE", "WOODWIND"),
-    ("TRUMPET", "BRASS"),
-    ("MELLOPHONE", "BRASS"),
-    ("TROMBONE", "BRASS"),
-    ("EUPHONIUM / BARITONE", "BRASS"),
-    ("SOUSAPHONE", "BRASS"),
-    ("SNARE DRUM", "PERCUSSION"),
-    ("TENOR DRUMS", "PERCUSSION"),
-    ("BASS DRUM", "PERCUSSION"),
-    ("CYMBALS", "PERCUSSION"),
-]
-
-def connect_db():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    conn.execute("PRAGMA journal_mode = WAL;")
-    conn.execute("PRAGMA synchronous = NORMAL;")
-    return conn
-
-def table_info(conn, table):
-    cur = conn.execute(f"PRAGMA table_info({table})")
-    return cur.fetchall()
-
-def table_has_column(conn, table, col):
-    return any(r[1] == col for r in table_info(conn, table))
-
-def current_school_year_label():
-    today = date.today()
-    y = today.year
-    start = y if today.month >= 8 else y - 1
-    return f"{start}-{start+1}"
-
-def create_tables(conn):
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS STUDENTS (
-            STUDENT_ID INTEGER PRIMARY KEY,
-            FNAME TEXT NOT NULL,
-            LNAME TEXT NOT NULL,
-            CLASSIFICATION TEXT,
-            SECTION TEXT NOT NULL,
-            PRIMARY_ROLE TEXT,
-            SHIRT_SIZE TEXT,
-            SHOE_SIZE TEXT,
-            ACTIVE INTEGER NOT NULL DEFAULT 1,
-            UPDATED_AT TEXT
-        )
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS COMPLIANCE (
-            STUDENT_ID INTEGER PRIMARY KEY,
-            CREDIT_HOURS INTEGER NOT NULL DEFAULT 0,
-            GPA REAL NOT NULL DEFAULT 0.0,
-            DUES_PAID INTEGER NOT NULL DEFAULT 0,
-            LAST_VERIFIED_DATE TEXT,
-            FOREIGN KEY (STUDENT_ID) REFERENCES STUDENTS(STUDENT_ID) ON DELETE CASCADE
-        )
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS INSTRUMENT_TYPES (
-            TYPE_ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TYPE_NAME TEXT UNIQUE NOT NULL,
-            SECTION TEXT NOT NULL
-        )
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS INSTRUMENTS (
-            INSTRUMENT_ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TYPE_ID INTEGER NOT NULL,
-            SERIAL TEXT,
-            CONDITION_NOTES TEXT,
-            CHECKED_OUT_TO INTEGER UNIQUE,
-            CHECKED_OUT_DATE TEXT,
-            FOREIGN KEY (TYPE_ID) REFERENCES INSTRUMENT_TYPES(TYPE_ID) ON DELETE RESTRICT,
-            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
-        )
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS UNIFORMS (
-            UNIFORM_ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            COAT_SIZE TEXT,
-            PANT_SIZE TEXT,
-            COAT_NUMBER TEXT,
-            PANT_NUMBER TEXT,
-            CONDITION_NOTES TEXT,
-            CHECKED_OUT_TO INTEGER UNIQUE,
-            CHECKED_OUT_DATE TEXT,
-            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
-        )
-    """)
-
-    conn.execute("""
-        CREATE TABLE IF NOT EXISTS SHAKOS (
-            SHAKO_ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            SIZE TEXT,
-            CONDITION_NOTES TEXT,
-            CHECKED_OUT_TO INTEGER UNIQUE,
-            CHECKED_OUT_DATE TEXT,
-            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
-        )
-    """)
-
-    # Backwards-safe schema upgrades
-    if not table_has_column(conn, "STUDENTS", "PRIMARY_ROLE"):
-        conn.execute("ALTER TABLE STUDENTS ADD COLUMN PRIMARY_ROLE TEXT")
-    if not table_has_column(conn, "STUDENTS", "ACTIVE"):
-        conn.execute("ALTER TABLE STUDENTS ADD COLUMN ACTIVE INTEGER NOT NULL DEFAULT 1")
-    if not table_has_column(conn, "STUDENTS", "UPDATED_AT"):
-        conn.execute("ALTER TABLE STUDENTS ADD COLUMN UPDATED_AT TEXT")
-
-    # Seed instrument types
-    for name, sec in INSTRUMENT_CATALOG:
-        conn.execute(
-            "INSERT OR IGNORE INTO INSTRUMENT_TYPES (TYPE_NAME, SECTION) VALUES (?, ?)",
-            (name, sec)
-        )
-
-    conn.commit()
-
-def make_table_item(text, align_right=False, align_center=False):
-    item = QTableWidgetItem("" if text is None else str(text))
-    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-    if align_center:
-        item.setTextAlignment(Qt.AlignCenter)
-    elif align_right:
-        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-
-    return item
-
-def is_eligible(credit_hours, gpa, dues_paid):
-    return credit_hours >= 12 and gpa >= 3.0 and dues_paid == 1
-
-def check_student_exists(conn, student_id):
-    cur = conn.execute("SELECT 1 FROM STUDENTS WHERE STUDENT_ID=?", (student_id,))
-    return cur.fetchone() is not None
-
-def get_student_name(conn, student_id):
-    cur = conn.execute("SELECT FNAME, LNAME FROM STUDENTS WHERE STUDENT_ID=?", (student_id,))
-    r = cur.fetchone()
-    return f"{r[0]} {r[1]}" if r else ""
-
-def get_student_section(conn, student_id):
-    cur = conn.execute("SELECT COALESCE(SECTION,'') FROM STUDENTS WHERE STUDENT_ID=?", (student_id,))
-    r = cur.fetchone()
-    return (r[0] if r else "") or ""
-
-def get_instrument_section_by_id(conn, instrument_id):
-    cur = conn.execute("""
-        SELECT t.SECTION
-        FROM INSTRUMENTS i
-        JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
-        WHERE i.INSTRUMENT_ID=?
-    """, (instrument_id,))
-    r = cur.fetchone()
-    return (r[0] if r else "") or ""
-
-class ComplianceDialog(QDialog):
-    def __init__(self, parent, conn):
-        super().__init__(parent)
-        self.setWindowTitle("Compliance Manager")
-        self.conn = conn
-        self.undo_push = parent.push_undo_ops
-        self.refresh_all = parent.refresh_all
-        self.show_error = parent.show_error
-        self.show_message = parent.show_message
-        self.apply_shadow = parent.apply_shadow
-        self.resize(950, 620)
-        self.setup_ui()
-        self.load()
-
-    def setup_ui(self):
-        root = QVBoxLayout(self)
-
-        top = QHBoxLayout()
-        self.search = QLineEdit()
-        self.search.setPlaceholderText("Search by ID or name…")
-        self.search.textChanged.connect(self.load)
-        top.addWidget(self.search)
-
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load)
-        top.addWidget(refresh_btn)
-
-        export_btn = QPushButton("Export CSV")
-        export_btn.clicked.connect(self.export_csv)
-        top.addWidget(export_btn)
-
-        root.addLayout(top)
-
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Name", "Credits", "GPA", "Dues", "Eligible", "Last Verified", "Active"
-        ])
-        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.table.setAlternatingRowColors(True)
-        self.table.verticalHeader().setVisible(False)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.itemSelectionChanged.connect(self.on_select)
-        self.table.setShowGrid(True)
-        root.addWidget(self.table)
-
-        bottom = QHBoxLayout()
-
-        edit_group = QGroupBox("Edit Selected")
-        form = QFormLayout(edit_group)
-
-        self.sel = QLabel("No student selected")
-        self.sel.setObjectName("highlight")
-        form.addRow("Selected:", self.sel)
-
-        self.credits = QSpinBox()
-        self.credits.setRange(0, 30)
-        form.addRow("Credit Hours:", self.credits)
-
-        self.gpa = QDoubleSpinBox()
-        self.gpa.setRange(0.0, 4.0)
-        self.gpa.setDecimals(2)
-        form.addRow("GPA:", self.gpa)
-
-        self.dues = QComboBox()
-        self.dues.addItems(["No", "Yes"])
-        form.addRow("Dues Paid:", self.dues)
-
-        self.save_btn = QPushButton("Save")
-        self.save_btn.setEnabled(False)
-        self.save_btn.clicked.connect(self.save)
-        form.addRow(self.save_btn)
-
-        bottom.addWidget(edit_group)
-        root.addLayout(bottom)
-
-        self.apply_shadow(edit_group)
-
-    def load(self):
-        q = self.search.text().strip()
-        where = ""
-        params = []
-        if q:
-            where = "WHERE s.STUDENT_ID LIKE ? OR (s.FNAME || ' ' || s.LNAME) LIKE ?"
-            params = [f"%{q}%", f"%{q}%"]
-
-        cur = self.conn.execute(f"""
-            SELECT s.STUDENT_ID,
-                   s.FNAME || ' ' || s.LNAME,
-                   COALESCE(c.CREDIT_HOURS, 0),
-                   COALESCE(c.GPA, 0.0),
-                   COALESCE(c.DUES_PAID, 0),
-                   COALESCE(c.LAST_VERIFIED_DATE, ''),
-                   COALESCE(s.ACTIVE, 1)
-            FROM STUDENTS s
-            LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
-            {where}
-            ORDER BY s.LNAME, s.FNAME
-        """, params)
-
-        rows = cur.fetchall()
-        self.table.setRowCount(0)
-        for r in rows:
-            sid, name, credits, gpa, dues, last, active = r
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            eligible = is_eligible(credits, gpa, dues)
-            self.table.setItem(row, 0, make_table_item(sid, True))
-            self.table.setItem(row, 1, make_table_item(name))
-            self.table.setItem(row, 2, make_table_item(credits, True))
-            self.table.setItem(row, 3, make_table_item(f"{gpa:.2f}", True))
-            self.table.setItem(row, 4, make_table_item("Yes" if dues == 1 else "No"))
-            self.table.setItem(row, 5, make_table_item("YES" if eligible else "NO"))
-            self.table.setItem(row, 6, make_table_item(last))
-            self.table.setItem(row, 7, make_table_item("Yes" if active == 1 else "No"))
-
-        self.table.resizeColumnsToContents()
-
-    def on_select(self):
-        row = self.table.currentRow()
-        if row < 0:
-            self.sel.setText("No student selected")
-            self.save_btn.setEnabled(False)
-            return
-
-        sid = int(self.table.item(row, 0).text())
-        name = self.table.item(row, 1).text()
-
-        self.sel.setText(f"{sid} - {name}")
-        self.save_btn.setEnabled(True)
-
-        credits = int(self.table.item(row, 2).text())
-        gpa = float(self.table.item(row, 3).text())
-        dues = 1 if self.table.item(row, 4).text() == "Yes" else 0
-
-        self.credits.setValue(credits)
-        self.gpa.setValue(gpa)
-        self.dues.setCurrentIndex(1 if dues == 1 else 0)
-
-    def save(self):
-        row = self.table.currentRow()
-        if row < 0:
-            return
-        sid = int(self.table.item(row, 0).text())
-
-        cur = self.conn.execute("""
-            SELECT COALESCE(CREDIT_HOURS, 0), COALESCE(GPA, 0.0), COALESCE(DUES_PAID, 0), COALESCE(LAST_VERIFIED_DATE, '')
-            FROM COMPLIANCE WHERE STUDENT_ID=?
-        """, (sid,))
-        old = cur.fetchone() or (0, 0.0, 0, "")
-
-        new_credits = self.credits.value()
-        new_gpa = self.gpa.value()
-        new_dues = 1 if self.dues.currentIndex() == 1 else 0
-        new_date = date.today().isoformat()
-
-        ops = [
-            ("INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
-             "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
-             (sid, new_credits, new_gpa, new_dues, new_date))
-        ]
-
-        undo_ops = [
-            ("INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
-             "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
-             (sid, old[0], old[1], old[2], old[3]))
-        ]
-
-        try:
-            self.conn.execute("BEGIN")
-            for sql, params in ops:
-                self.conn.execute(sql, params)
-            self.conn.commit()
-            self.undo_push("Edit Compliance", undo_ops)
-            self.load()
-            self.refresh_all()
-        except Exception as e:
-            self.conn.rollback()
-            self.show_error(f"Error: {str(e)}")
-
-    def export_csv(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Compliance Report", "compliance_report.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            cur = self.conn.execute("""
-                SELECT s.STUDENT_ID, s.FNAME, s.LNAME, COALESCE(s.CLASSIFICATION, ''), COALESCE(s.SECTION, ''),
-                       COALESCE(c.CREDIT_HOURS, 0), COALESCE(c.GPA, 0.0), COALESCE(c.DUES_PAID, 0), COALESCE(c.LAST_VERIFIED_DATE, '')
-                FROM STUDENTS s
-                LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
-                ORDER BY s.SECTION, s.LNAME, s.FNAME
-            """)
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["Student ID", "First", "Last", "Class", "Section", "Credits", "GPA", "Dues Paid", "Eligible", "Last Verified"])
-                for r in cur.fetchall():
-                    eligible = is_eligible(r[5], r[6], r[7])
-                    w.writerow([r[0], r[1], r[2], r[3], r[4], r[5], f"{r[6]:.2f}", "Yes" if r[7] == 1 else "No", "Yes" if eligible else "No", r[8]])
-            self.show_message("Saved", f"Saved to:\n{path}")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-class InventoryDialog(QDialog):
-    def __init__(self, parent, conn):
-        super().__init__(parent)
-        self.setWindowTitle("Inventory Viewer")
-        self.conn = conn
-        self.apply_shadow = parent.apply_shadow
-        self.show_error = parent.show_error
-        self.show_message = parent.show_message
-        self.refresh_all = parent.refresh_all
-        self.undo_push = parent.push_undo_ops
-        self.resize(1100, 680)
-        self.setup_ui()
-        self.load_all()
-
-    def setup_ui(self):
-        root = QVBoxLayout(self)
-
-        top = QHBoxLayout()
-        self.search = QLineEdit()
-        self.search.setPlaceholderText("Search inventory… (type, serial, size, assigned ID)")
-        self.search.textChanged.connect(self.load_all)
-        top.addWidget(self.search)
-
-        self.section_filter = QComboBox()
-        self.section_filter.addItems(["All Sections"] + SECTIONS)
-        self.section_filter.currentIndexChanged.connect(self.load_all)
-        top.addWidget(self.section_filter)
-
-        export_btn = QPushButton("Export Inventory CSV")
-        export_btn.clicked.connect(self.export_csv)
-        top.addWidget(export_btn)
-
-        root.addLayout(top)
-
-        self.tabs = QTabWidget()
-        root.addWidget(self.tabs)
-
-        self.instr = QTableWidget(0, 8)
-        self.instr.setHorizontalHeaderLabels(["ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"])
-        self._prep_table(self.instr)
-        self.tabs.addTab(self.instr, "Instruments")
-
-        self.uni = QTableWidget(0, 10)
-        self.uni.setHorizontalHeaderLabels(["ID", "Coat", "Pant", "Coat #", "Pant #", "Condition", "Assigned To", "Date", "Available", "Size Key"])
-        self._prep_table(self.uni)
-        self.tabs.addTab(self.uni, "Uniforms")
-
-        self.sha = QTableWidget(0, 7)
-        self.sha.setHorizontalHeaderLabels(["ID", "Size", "Condition", "Assigned To", "Date", "Available", "Size Key"])
-        self._prep_table(self.sha)
-        self.tabs.addTab(self.sha, "Shakos")
-
-        footer = QHBoxLayout()
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_all)
-        footer.addWidget(refresh_btn)
-
-        footer.addStretch()
-        root.addLayout(footer)
-
-    def _prep_table(self, t):
-        t.setSelectionBehavior(QAbstractItemView.SelectRows)
-        t.setAlternatingRowColors(True)
-        t.verticalHeader().setVisible(False)
-        t.horizontalHeader().setStretchLastSection(True)
-        t.setWordWrap(False)
-        t.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        t.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-        t.setShowGrid(True)
-
-    def load_all(self):
-        q = self.search.text().strip()
-        sec = self.section_filter.currentText()
-
-        instr_where = []
-        params = []
-
-        if sec != "All Sections":
-            instr_where.append("t.SECTION=?")
-            params.append(sec)
-
-        if q:
-            instr_where.append("(t.TYPE_NAME LIKE ? OR COALESCE(i.SERIAL,'') LIKE ? OR COALESCE(i.CONDITION_NOTES,'') LIKE ? OR COALESCE(i.CHECKED_OUT_TO,'') LIKE ?)")
-            params.extend([f"%{q}%"] * 4)
-
-        instr_where_sql = ("WHERE " + " AND ".join(instr_where)) if instr_where else ""
-
-        cur = self.conn.execute(f"""
-            SELECT i.INSTRUMENT_ID, t.TYPE_NAME, t.SECTION,
-                   COALESCE(i.SERIAL,''), COALESCE(i.CONDITION_NOTES,''),
-                   COALESCE(i.CHECKED_OUT_TO,''), COALESCE(i.CHECKED_OUT_DATE,''),
-                   CASE WHEN i.CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-            FROM INSTRUMENTS i
-            JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
-            {instr_where_sql}
-            ORDER BY t.SECTION, t.TYPE_NAME, i.INSTRUMENT_ID
-        """, params)
-
-        rows = cur.fetchall()
-        self.instr.setRowCount(0)
-        for r in rows:
-            row = self.instr.rowCount()
-            self.instr.insertRow(row)
-            for c in range(8):
-                self.instr.setItem(row, c, make_table_item(r[c]))
-        self.instr.resizeColumnsToContents()
-
-        u_where = []
-        u_params = []
-
-        if q:
-            u_where.append("(COALESCE(COAT_SIZE,'') LIKE ? OR COALESCE(PANT_SIZE,'') LIKE ? OR COALESCE(COAT_NUMBER,'') LIKE ? OR COALESCE(PANT_NUMBER,'') LIKE ? OR COALESCE(CONDITION_NOTES,'') LIKE ? OR COALESCE(CHECKED_OUT_TO,'') LIKE ?)")
-            u_params.extend([f"%{q}%"] * 6)
-        u_where_sql = ("WHERE " + " AND ".join(u_where)) if u_where else ""
-
-        cur = self.conn.execute(f"""
-            SELECT UNIFORM_ID, COALESCE(COAT_SIZE,''), COALESCE(PANT_SIZE,''),
-                   COALESCE(COAT_NUMBER,''), COALESCE(PANT_NUMBER,''),
-                   COALESCE(CONDITION_NOTES,''),
-                   COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END,
-                   (COALESCE(COAT_SIZE,'') || '/' || COALESCE(PANT_SIZE,''))
-            FROM UNIFORMS
-            {u_where_sql}
-            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID
-        """, u_params)
-
-        rows = cur.fetchall()
-        self.uni.setRowCount(0)
-        for r in rows:
-            row = self.uni.rowCount()
-            self.uni.insertRow(row)
-            for c in range(10):
-                self.uni.setItem(row, c, make_table_item(r[c]))
-        self.uni.resizeColumnsToContents()
-
-        s_where = []
-        s_params = []
-        if q:
-            s_where.append("(COALESCE(SIZE,'') LIKE ? OR COALESCE(CONDITION_NOTES,'') LIKE ? OR COALESCE(CHECKED_OUT_TO,'') LIKE ?)")
-            s_params.extend([f"%{q}%"] * 3)
-        s_where_sql = ("WHERE " + " AND ".join(s_where)) if s_where else ""
-
-        cur = self.conn.execute(f"""
-            SELECT SHAKO_ID, COALESCE(SIZE,''), COALESCE(CONDITION_NOTES,''),
-                   COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END,
-                   COALESCE(SIZE,'')
-            FROM SHAKOS
-            {s_where_sql}
-            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID
-        """, s_params)
-
-        rows = cur.fetchall()
-        self.sha.setRowCount(0)
-        for r in rows:
-            row = self.sha.rowCount()
-            self.sha.insertRow(row)
-            for c in range(7):
-                self.sha.setItem(row, c, make_table_item(r[c]))
-        self.sha.resizeColumnsToContents()
-
-    def export_csv(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Inventory", "inventory.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["INSTRUMENTS"])
-                w.writerow(["ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"])
-                cur = self.conn.execute("""
-                    SELECT i.INSTRUMENT_ID, t.TYPE_NAME, t.SECTION, COALESCE(i.SERIAL,''), COALESCE(i.CONDITION_NOTES,''),
-                           COALESCE(i.CHECKED_OUT_TO,''), COALESCE(i.CHECKED_OUT_DATE,''),
-                           CASE WHEN i.CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-                    FROM INSTRUMENTS i
-                    JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
-                    ORDER BY t.SECTION, t.TYPE_NAME, i.INSTRUMENT_ID
-                """)
-                for r in cur.fetchall():
-                    w.writerow(list(r))
-
-                w.writerow([])
-                w.writerow(["UNIFORMS"])
-                w.writerow(["ID", "Coat", "Pant", "Coat #", "Pant #", "Condition", "Assigned To", "Date", "Available"])
-                cur = self.conn.execute("""
-                    SELECT UNIFORM_ID, COALESCE(COAT_SIZE,''), COALESCE(PANT_SIZE,''), COALESCE(COAT_NUMBER,''), COALESCE(PANT_NUMBER,''),
-                           COALESCE(CONDITION_NOTES,''), COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                           CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-                    FROM UNIFORMS
-                    ORDER BY (CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID
-                """)
-                for r in cur.fetchall():
-                    w.writerow(list(r))
-
-                w.writerow([])
-                w.writerow(["SHAKOS"])
-                w.writerow(["ID", "Size", "Condition", "Assigned To", "Date", "Available"])
-                cur = self.conn.execute("""
-                    SELECT SHAKO_ID, COALESCE(SIZE,''), COALESCE(CONDITION_NOTES,''), COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                           CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-                    FROM SHAKOS
-                    ORDER BY (CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID
-                """)
-                for r in cur.fetchall():
-                    w.writerow(list(r))
-            self.show_message("Saved", f"Saved to:\n{path}")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-class BandDatabaseApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Marching Band Database")
-
-        self.conn = connect_db()
-        create_tables(self.conn)
-        seed_sample_data(self.conn)
-
-        self.students_requires_school_year = (
-            table_has_column(self.conn, "STUDENTS", "SCHOOL_YEAR") and
-            any(r[1] == "SCHOOL_YEAR" and bool(r[3]) for r in table_info(self.conn, "STUDENTS"))
-        )
-
-        self.undo_stack = []
-
-        self.current_zoom = 100
-        self.current_font_size = 12
-        self.high_contrast_mode = False
-
-        self.setup_ui()
-
-    def setup_ui(self):
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
-        self.root_layout = QVBoxLayout(main_widget)
-
-        self.setup_menu_bar()
-
-        self.tabs = QTabWidget()
-        self.root_layout.addWidget(self.tabs)
-
-        self.create_students_tab()
-        self.create_uniforms_tab()
-        self.create_shakos_tab()
-        self.create_instruments_tab()
-
-        self.status_bar = QLabel("Ready | Zoom: 100% | Normal Mode")
-        self.status_bar.setStyleSheet("""
-            QLabel {
-                background-color: #2c3e50;
-                color: white;
-                padding: 8px;
-                border-top: 2px solid #cd7b00;
-                font-weight: bold;
-            }
-        """)
-        self.root_layout.addWidget(self.status_bar)
-
-        self.setup_colors()
-        self.refresh_all()
-        self.rebuild_completers()
-
-    def setup_menu_bar(self):
-        menubar = self.menuBar()
-
-        file_menu = menubar.addMenu("&File")
-
-        inv_action = file_menu.addAction("Inventory Viewer")
-        inv_action.setShortcut("Ctrl+I")
-        inv_action.triggered.connect(self.open_inventory_viewer)
-
-        comp_action = file_menu.addAction("Compliance Manager")
-        comp_action.setShortcut("Ctrl+M")
-        comp_action.triggered.connect(self.open_compliance_manager)
-
-        file_menu.addSeparator()
-
-        export_students = file_menu.addAction("Export Students CSV")
-        export_students.triggered.connect(self.export_students_csv)
-
-        export_inventory = file_menu.addAction("Export Inventory CSV")
-        export_inventory.triggered.connect(self.export_inventory_csv)
-
-        export_compliance = file_menu.addAction("Export Compliance CSV")
-        export_compliance.triggered.connect(self.export_compliance_csv)
-
-        file_menu.addSeparator()
-
-        reset_db = file_menu.addAction("Reset Database (Wipe)")
-        reset_db.setShortcut("Ctrl+Shift+R")
-        reset_db.triggered.connect(self.reset_database)
-
-        file_menu.addSeparator()
-
-        exit_action = file_menu.addAction("Exit")
-        exit_action.setShortcut("Alt+F4")
-        exit_action.triggered.connect(self.close)
-
-        edit_menu = menubar.addMenu("&Edit")
-        undo_action = edit_menu.addAction("&Undo")
-        undo_action.setShortcut("Ctrl+Z")
-        undo_action.triggered.connect(self.undo_last)
-
-        view_menu = menubar.addMenu("&View")
-        self.students_columns_menu = view_menu.addMenu("Students Columns")
-        self.students_col_actions = {}
-
-        accessibility_menu = menubar.addMenu("&Accessibility")
-
-        zoom_menu = accessibility_menu.addMenu("&Zoom")
-        zoom_in_action = zoom_menu.addAction("Zoom In (+10%)")
-        zoom_in_action.triggered.connect(self.zoom_in)
-        zoom_in_action.setShortcut("Ctrl+=")
-
-        zoom_out_action = zoom_menu.addAction("Zoom Out (-10%)")
-        zoom_out_action.triggered.connect(self.zoom_out)
-        zoom_out_action.setShortcut("Ctrl+-")
-
-        reset_zoom_action = zoom_menu.addAction("Reset Zoom (100%)")
-        reset_zoom_action.triggered.connect(self.reset_zoom)
-        reset_zoom_action.setShortcut("Ctrl+0")
-
-        accessibility_menu.addSeparator()
-
-        fullscreen_action = accessibility_menu.addAction("Fullscreen")
-        fullscreen_action.setCheckable(True)
-        fullscreen_action.setShortcut("F11")
-        fullscreen_action.triggered.connect(self.toggle_fullscreen)
-
-        accessibility_menu.addSeparator()
-
-        contrast_menu = accessibility_menu.addMenu("Contrast")
-        normal_action = contrast_menu.addAction("Normal Contrast")
-        normal_action.triggered.connect(lambda: self.enable_high_contrast_mode(False))
-        high_action = contrast_menu.addAction("High Contrast Mode")
-        high_action.triggered.connect(lambda: self.enable_high_contrast_mode(True))
-
-        accessibility_menu.addSeparator()
-
-        keyboard_action = accessibility_menu.addAction("Keyboard Navigation Help")
-        keyboard_action.triggered.connect(self.show_keyboard_help)
-        keyboard_action.setShortcut("F1")
-
-    def setup_colors(self):
-        if self.high_contrast_mode:
-            self.setStyleSheet(self.get_high_contrast_stylesheet())
-        else:
-            self.setStyleSheet(self.get_normal_stylesheet())
-
-    def set_button_icon_safe(self, btn, preferred_sp, fallback_text):
-        try:
-            btn.setIcon(self.style().standardIcon(preferred_sp))
-        except Exception:
-            btn.setText(fallback_text)
-
-    def get_normal_stylesheet(self):
-        return f"""
-            QMainWindow {{
-                background-color: #f5f7fa;
-            }}
-            QWidget {{
-                font-family: Segoe UI, Arial, sans-serif;
-                font-size: {self.current_font_size}px;
-            }}
-            QFrame#card {{
-                background-color: white;
-                border: 2px solid #d1d8e0;
-                border-radius: 12px;
-            }}
-            QGroupBox {{
-                border: 2px solid #d1d8e0;
-                border-radius: 10px;
-                margin-top: 22px;
-                padding: 12px;
-                padding-top: 18px;
-                font-weight: bold;
-                color: #2c3e50;
-                background-color: white;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 12px;
-                top: 2px;
-                padding: 2px 8px;
-                color: #cd7b00;
-                background-color: white;
-            }}
-            QPushButton {{
-                background-color: #cd7b00;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: {self.current_font_size}px;
-            }}
-            QPushButton:hover {{
-                background-color: #b36b00;
-            }}
-            QPushButton:disabled {{
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }}
-            QToolButton {{
-                background-color: #d1d8e0;
-                border: none;
-                border-radius: 8px;
-                padding: 6px;
-            }}
-            QToolButton:checked {{
-                background-color: #cd7b00;
-            }}
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
-                border: 1px solid #bdc3c7;
-                border-radius: 6px;
-                padding: 7px;
-                background-color: white;
-                color: #2c3e50;
-                font-size: {self.current_font_size}px;
-            }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-                border: 2px solid #cd7b00;
-            }}
-
-            QComboBox QAbstractItemView {{
-                max-height: 160px;
-            }}
-
-            QTableWidget {{
-                background-color: white;
-                border: 1px solid #d1d8e0;
-                gridline-color: rgba(44, 62, 80, 35);
-                selection-background-color: #cd7b00;
-                selection-color: white;
-                font-size: {self.current_font_size}px;
-                border-radius: 8px;
-            }}
-            QHeaderView::section {{
-                background-color: #006600;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }}
-            QTabWidget::pane {{
-                border: 1px solid #d1d8e0;
-                background-color: white;
-                border-radius: 10px;
-            }}
-            QTabBar::tab {{
-                background-color: #d1d8e0;
-                color: #2c3e50;
-                padding: 8px 16px;
-                margin-right: 2px;
-                font-weight: bold;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: #cd7b00;
-                color: white;
-            }}
-            QLabel#highlight {{
-                font-weight: bold;
-                color: #e74c3c;
-                font-size: {self.current_font_size + 1}px;
-            }}
-        """
-
-    def get_high_contrast_stylesheet(self):
-        return f"""
-            QMainWindow {{
-                background-color: #000000;
-            }}
-            QWidget {{
-                font-family: Segoe UI, Arial, sans-serif;
-                font-size: {max(self.current_font_size, 13)}px;
-                color: #FFFFFF;
-            }}
-            QFrame#card {{
-                background-color: white;
-                border: 2px solid #d1d8e0;
-                border-radius: 12px;
-            }}
-            QGroupBox {{
-                border: 3px solid #FFFFFF;
-                border-radius: 10px;
-                margin-top: 12px;
-                padding-top: 12px;
-                font-weight: bold;
-                color: #FFFFFF;
-                background-color: #000000;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 6px;
-                color: #FFFF00;
-                background-color: #000000;
-            }}
-            QPushButton {{
-                background-color: #000000;
-                color: #FFFFFF;
-                border: 2px solid #FFFFFF;
-                padding: 10px 18px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: {max(self.current_font_size, 13)}px;
-            }}
-            QPushButton:hover {{
-                background-color: #333333;
-                border: 3px solid #FFFF00;
-            }}
-            QToolButton {{
-                background-color: #333333;
-                border: 2px solid #FFFFFF;
-                border-radius: 8px;
-                padding: 6px;
-            }}
-            QToolButton:checked {{
-                background-color: #0000FF;
-                border-bottom: 3px solid #FFFF00;
-            }}
-            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
-                border: 2px solid #FFFFFF;
-                border-radius: 6px;
-                padding: 8px;
-                background-color: #000000;
-                color: #FFFFFF;
-                font-size: {max(self.current_font_size, 13)}px;
-            }}
-            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-                border: 3px solid #00FFFF;
-                background-color: #111111;
-            }}
-
-            QComboBox QAbstractItemView {{
-                max-height: 160px;
-            }}
-
-            QTableWidget {{
-                background-color: #000000;
-                border: 2px solid #FFFFFF;
-                gridline-color: rgba(255,255,255,80);
-                selection-background-color: #0000FF;
-                selection-color: #FFFFFF;
-                alternate-background-color: #111111;
-                font-size: {max(self.current_font_size, 13)}px;
-                border-radius: 8px;
-            }}
-            QHeaderView::section {{
-                background-color: #000000;
-                color: #FFFFFF;
-                padding: 10px;
-                border: 1px solid #FFFFFF;
-                font-weight: bold;
-            }}
-            QTabWidget::pane {{
-                border: 2px solid #FFFFFF;
-                background-color: #000000;
-                border-radius: 10px;
-            }}
-            QTabBar::tab {{
-                background-color: #333333;
-                color: #FFFFFF;
-                padding: 10px 18px;
-                margin-right: 2px;
-                font-weight: bold;
-                border-top-left-radius: 10px;
-                border-top-right-radius: 10px;
-            }}
-            QTabBar::tab:selected {{
-                background-color: #0000FF;
-                color: #FFFFFF;
-                border-bottom: 3px solid #FFFF00;
-            }}
-            QLabel#highlight {{
-                font-weight: bold;
-                color: #FFFF00;
-                font-size: {max(self.current_font_size + 1, 14)}px;
-                border: 1px solid #FFFF00;
-                padding: 2px;
-            }}
-        """
-
-    def apply_shadow(self, widget, blur=22, x=0, y=6):
-        eff = QGraphicsDropShadowEffect(self)
-        eff.setBlurRadius(blur)
-        eff.setOffset(x, y)
-        eff.setColor(Qt.black)
-        widget.setGraphicsEffect(eff)
-
-    def push_undo_ops(self, label, undo_ops):
-        self.undo_stack.append((label, undo_ops))
-        self.update_status(f"{label} | Undo ready")
-
-    def undo_last(self):
-        if not self.undo_stack:
-            self.show_error("Nothing to undo")
-            return
-        label, ops = self.undo_stack.pop()
-        try:
-            self.conn.execute("BEGIN")
-            for sql, params in ops:
-                self.conn.execute(sql, params)
-            self.conn.commit()
-            self.refresh_all()
-            self.update_status(f"Undid: {label}")
-        except Exception as e:
-            self.conn.rollback()
-            self.show_error(f"Undo failed: {str(e)}")
-
-    def update_status(self, message):
-        mode = "High Contrast" if self.high_contrast_mode else "Normal"
-        self.status_bar.setText(f"{message} | Zoom: {self.current_zoom}% | {mode} Mode")
-
-    def show_message(self, title, message):
-        QMessageBox.information(self, title, message)
-
-    def show_error(self, message):
-        QMessageBox.critical(self, "Error", message)
-
-    def ask_yes_no(self, title, question):
-        reply = QMessageBox.question(self, title, question, QMessageBox.Yes | QMessageBox.No)
-        return reply == QMessageBox.Yes
-
-    def validate_required(self, field: QLineEdit):
-        ok = bool(field.text().strip())
-        field.setStyleSheet("" if ok else "border: 2px solid #e74c3c;")
-        return ok
-
-    def rebuild_completers(self):
-        cur = self.conn.execute("SELECT STUDENT_ID FROM STUDENTS ORDER BY STUDENT_ID")
-        ids = [str(r[0]) for r in cur.fetchall()]
-        completer = QCompleter(ids)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchContains)
-        for le in [self.add_id, self.edit_id_readonly, self.assign_instr_student, self.assign_uni_student, self.assign_shako_student]:
-            le.setCompleter(completer)
-
-    def toggle_fullscreen(self, checked):
-        if checked:
-            self.showFullScreen()
-        else:
-            self.showNormal()
-
-    def open_compliance_manager(self):
-        dlg = ComplianceDialog(self, self.conn)
-        dlg.exec()
-
-    def open_inventory_viewer(self):
-        dlg = InventoryDialog(self, self.conn)
-        dlg.exec()
-
-    def export_students_csv(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Save Students", "students.csv", "CSV Files (*.csv)")
-        if not path:
-            return
-        try:
-            cur = self.conn.execute("""
-                SELECT STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''),
-                       COALESCE(PRIMARY_ROLE,''), COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
-                FROM STUDENTS
-                ORDER BY SECTION, LNAME, FNAME
-            """)
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["Student ID", "First", "Last", "Class", "Section", "Instrument", "Shirt", "Shoe", "Active", "Updated"])
-                for r in cur.fetchall():
-                    w.writerow([r[0], r[1], r[2], r[3], r[4], r[5], r[6], r[7], "Yes" if r[8] == 1 else "No", r[9]])
-            self.show_message("Saved", f"Saved to:\n{path}")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def export_inventory_csv(self):
-        dlg = InventoryDialog(self, self.conn)
-        dlg.export_csv()
-
-    def export_compliance_csv(self):
-        dlg = ComplianceDialog(self, self.conn)
-        dlg.export_csv()
-
-    def reset_database(self):
-        if not self.ask_yes_no("Reset Database", "Wipe EVERYTHING and start fresh? This cannot be undone."):
-            return
-        try:
-            self.conn.close()
-        except Exception:
-            pass
-        try:
-            if os.path.exists(DB_PATH):
-                os.remove(DB_PATH)
-        except Exception as e:
-            self.show_error(f"Could not remove database file: {str(e)}")
-            self.conn = connect_db()
-            create_tables(self.conn)
-            return
-
-        self.conn = connect_db()
-        create_tables(self.conn)
-        self.undo_stack.clear()
-        self.refresh_all()
-        self.rebuild_completers()
-        self.update_status("Database reset")
-
-    def zoom_in(self):
-        self.current_zoom = min(200, self.current_zoom + 10)
-        self.current_font_size = int(12 * (self.current_zoom / 100))
-        self.setup_colors()
-        self.update_status("Zoom updated")
-
-    def zoom_out(self):
-        self.current_zoom = max(50, self.current_zoom - 10)
-        self.current_font_size = int(12 * (self.current_zoom / 100))
-        self.setup_colors()
-        self.update_status("Zoom updated")
-
-    def reset_zoom(self):
-        self.current_zoom = 100
-        self.current_font_size = 12
-        self.setup_colors()
-        self.update_status("Zoom reset")
-
-    def enable_high_contrast_mode(self, enable):
-        self.high_contrast_mode = enable
-        self.setup_colors()
-        mode = "High Contrast" if enable else "Normal"
-        self.update_status(f"{mode} Mode enabled")
-
-    def show_keyboard_help(self):
-        help_text = """
-KEYBOARD SHORTCUTS
-
-General:
-• Tab / Shift+Tab: Move focus
-• Enter: Activate button / confirm
-• Ctrl+Z: Undo
-• Ctrl+I: Inventory Viewer
-• Ctrl+M: Compliance Manager
-• F11: Fullscreen
-
-Accessibility:
-• Ctrl+= : Zoom in
-• Ctrl+- : Zoom out
-• Ctrl+0 : Reset zoom
-"""
-        QMessageBox.information(self, "Keyboard Help", help_text)
-
-    # STUDENTS MENU
-    def create_students_tab(self):
-        tab = QWidget()
-        self.tabs.addTab(tab, "Students")
-        layout = QVBoxLayout(tab)
-
-        header = QHBoxLayout()
-        title = QLabel("Roster")
-        title.setStyleSheet("font-weight: bold; padding: 0px; margin: 0px;")
-        header.addWidget(title)
-        header.addStretch()
-        header.setSpacing(4)
-        header.setContentsMargins(0, 0, 0, 0)
-
-        layout.addLayout(header)
-
-        search_row = QHBoxLayout()
-        search_row.setSpacing(6)
-        search_row.setContentsMargins(0, 0, 0, 0)
-
-        self.student_search = QLineEdit()
-        self.student_search.setPlaceholderText("Search roster… (ID, name, section, instrument)")
-        self.student_search.textChanged.connect(self.load_students)
-        search_row.addWidget(self.student_search)
-
-        self.active_only = QCheckBox("Active only")
-        self.active_only.setChecked(True)
-        self.active_only.stateChanged.connect(self.load_students)
-        search_row.addWidget(self.active_only)
-
-        layout.addLayout(search_row)
-
-        self.students_splitter = QSplitter(Qt.Horizontal)
-        layout.addWidget(self.students_splitter)
-
-        roster_wrap = QWidget()
-        roster_layout = QVBoxLayout(roster_wrap)
-        roster_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.students_table = QTableWidget(0, 10)
-        self.students_table.setHorizontalHeaderLabels([
-            "ID", "First", "Last", "Class", "Section", "Instrument", "Shirt", "Shoe", "Active", "Eligible"
-        ])
-        self.students_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.students_table.setAlternatingRowColors(True)
-        self.students_table.verticalHeader().setVisible(False)
-        self.students_table.horizontalHeader().setStretchLastSection(True)
-        self.students_table.setWordWrap(False)
-        self.students_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.students_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.students_table.itemSelectionChanged.connect(self.on_student_selected)
-        self.students_table.setShowGrid(True)
-        roster_layout.addWidget(self.students_table)
-
-        roster_controls = QHBoxLayout()
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_students)
-        roster_controls.addWidget(refresh_btn)
-
-        self.find_id = QLineEdit()
-        self.find_id.setPlaceholderText("Type ID to jump…")
-        self.find_id.returnPressed.connect(self.jump_to_student)
-        roster_controls.addWidget(self.find_id)
-
-        delete_btn = QPushButton("Delete Selected")
-        delete_btn.clicked.connect(self.delete_student)
-        roster_controls.addWidget(delete_btn)
-
-        roster_controls.addStretch()
-        roster_layout.addLayout(roster_controls)
-
-        forms_wrap = QWidget()
-        forms_layout = QVBoxLayout(forms_wrap)
-        forms_layout.setContentsMargins(0, 0, 0, 0)
-
-        self.student_forms_tabs = QTabWidget()
-        forms_layout.addWidget(self.student_forms_tabs)
-
-        add_tab = QWidget()
-        add_layout = QHBoxLayout(add_tab)
-
-        add_group = QGroupBox("Add Student")
-        add_form = QFormLayout(add_group)
-
-        self.add_id = QLineEdit()
-        self.add_id.setPlaceholderText("Student ID")
-        self.add_id.textChanged.connect(lambda: self.validate_required(self.add_id))
-        add_form.addRow("Student ID*:", self.add_id)
-
-        self.add_first = QLineEdit()
-        add_form.addRow("First Name*:", self.add_first)
-
-        self.add_last = QLineEdit()
-        add_form.addRow("Last Name*:", self.add_last)
-
-        self.add_class = QComboBox()
-        self.add_class.addItems(CLASSIFICATIONS)
-        add_form.addRow("Class:", self.add_class)
-
-        self.add_section = QComboBox()
-        self.add_section.addItems(SECTIONS)
-        add_form.addRow("Section*:", self.add_section)
-
-        self.add_role = QComboBox()
-        self.add_role.addItems([""] + [x[0] for x in INSTRUMENT_CATALOG] + ["DRUM MAJOR", "OTHER"])
-        add_form.addRow("Instrument:", self.add_role)
-
-        self.add_shirt = QComboBox()
-        self.add_shirt.addItems(SHIRT_SIZES)
-        add_form.addRow("Shirt Size:", self.add_shirt)
-
-        self.add_shoe = QComboBox()
-        self.add_shoe.addItems(SHOE_SIZES)
-        add_form.addRow("Shoe Size:", self.add_shoe)
-
-        self.add_active = QCheckBox("Active")
-        self.add_active.setChecked(True)
-        add_form.addRow("", self.add_active)
-
-        add_btn = QPushButton("Add")
-        add_btn.clicked.connect(self.add_student)
-        add_form.addRow(add_btn)
-
-        add_layout.addWidget(add_group)
-        add_layout.addStretch()
-        self.student_forms_tabs.addTab(add_tab, "Add")
-
-        edit_tab = QWidget()
-        edit_layout = QHBoxLayout(edit_tab)
-
-        edit_group = QGroupBox("Edit Selected Student")
-        edit_form = QFormLayout(edit_group)
-
-        self.edit_id_readonly = QLineEdit()
-        self.edit_id_readonly.setReadOnly(True)
-        edit_form.addRow("Student ID:", self.edit_id_readonly)
-
-        self.edit_first = QLineEdit()
-        edit_form.addRow("First Name*:", self.edit_first)
-
-        self.edit_last = QLineEdit()
-        edit_form.addRow("Last Name*:", self.edit_last)
-
-        self.edit_class = QComboBox()
-        self.edit_class.addItems(CLASSIFICATIONS)
-        edit_form.addRow("Class:", self.edit_class)
-
-        self.edit_section = QComboBox()
-        self.edit_section.addItems(SECTIONS)
-        edit_form.addRow("Section*:", self.edit_section)
-
-        self.edit_role = QComboBox()
-        self.edit_role.addItems([""] + [x[0] for x in INSTRUMENT_CATALOG] + ["DRUM MAJOR", "OTHER"])
-        edit_form.addRow("Instrument:", self.edit_role)
-
-        self.edit_shirt = QComboBox()
-        self.edit_shirt.addItems(SHIRT_SIZES)
-        edit_form.addRow("Shirt Size:", self.edit_shirt)
-
-        self.edit_shoe = QComboBox()
-        self.edit_shoe.addItems(SHOE_SIZES)
-        edit_form.addRow("Shoe Size:", self.edit_shoe)
-
-        self.edit_active = QCheckBox("Active")
-        edit_form.addRow("", self.edit_active)
-
-        self.edit_save = QPushButton("Save Changes")
-        self.edit_save.setEnabled(False)
-        self.edit_save.clicked.connect(self.save_student_edits)
-        edit_form.addRow(self.edit_save)
-
-        edit_layout.addWidget(edit_group)
-        edit_layout.addStretch()
-        self.student_forms_tabs.addTab(edit_tab, "Edit")
-
-        self.students_splitter.addWidget(roster_wrap)
-        self.students_splitter.addWidget(forms_wrap)
-        self.students_splitter.setSizes([850, 450])
-
-        self.students_splitter.setHandleWidth(10)
-        self.students_splitter.setChildrenCollapsible(True)
-        self.students_splitter.setSizes([500, 250])
-
-        self.students_splitter.setStretchFactor(0, 4)
-        self.students_splitter.setStretchFactor(1, 2)
-
-        self.apply_shadow(add_group)
-        self.apply_shadow(edit_group)
-
-        self.build_students_columns_menu()
-
-    def build_students_columns_menu(self):
-        self.students_columns_menu.clear()
-        self.students_col_actions.clear()
-
-        names = [self.students_table.horizontalHeaderItem(i).text() for i in range(self.students_table.columnCount())]
-        for idx, name in enumerate(names):
-            act = QAction(name, self)
-            act.setCheckable(True)
-            act.setChecked(True)
-            act.toggled.connect(lambda checked, c=idx: self.students_table.setColumnHidden(c, not checked))
-            self.students_columns_menu.addAction(act)
-            self.students_col_actions[idx] = act
-
-        default_hide = ["Shirt", "Shoe"]
-        for idx, act in self.students_col_actions.items():
-            if act.text() in default_hide:
-                act.setChecked(False)
-
-    def load_students(self):
-        q = self.student_search.text().strip()
-        active_only = self.active_only.isChecked()
-
-        where = []
-        params = []
-
-        if active_only:
-            where.append("COALESCE(s.ACTIVE, 1) = 1")
-
-        if q:
-            where.append("(s.STUDENT_ID LIKE ? OR s.FNAME LIKE ? OR s.LNAME LIKE ? OR COALESCE(s.SECTION,'') LIKE ? OR COALESCE(s.PRIMARY_ROLE,'') LIKE ?)")
-            params.extend([f"%{q}%"] * 5)
-
-        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
-
-        cur = self.conn.execute(f"""
-            SELECT s.STUDENT_ID, s.FNAME, s.LNAME,
-                   COALESCE(s.CLASSIFICATION,''), COALESCE(s.SECTION,''),
-                   COALESCE(s.PRIMARY_ROLE,''), COALESCE(s.SHIRT_SIZE,''), COALESCE(s.SHOE_SIZE,''),
-                   COALESCE(s.ACTIVE,1),
-                   COALESCE(c.CREDIT_HOURS, 0), COALESCE(c.GPA, 0.0), COALESCE(c.DUES_PAID, 0)
-            FROM STUDENTS s
-            LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
-            {where_sql}
-            ORDER BY s.SECTION, s.LNAME, s.FNAME
-        """, params)
-
-        rows = cur.fetchall()
-        self.students_table.setRowCount(0)
-        for r in rows:
-            sid, fn, ln, cl, sec, role, shirt, shoe, active, credits, gpa, dues = r
-            eligible = is_eligible(credits, gpa, dues)
-
-            row = self.students_table.rowCount()
-            self.students_table.insertRow(row)
-            self.students_table.setItem(row, 0, make_table_item(sid, True))
-            self.students_table.setItem(row, 1, make_table_item(fn))
-            self.students_table.setItem(row, 2, make_table_item(ln))
-            self.students_table.setItem(row, 3, make_table_item(cl))
-            self.students_table.setItem(row, 4, make_table_item(sec))
-            self.students_table.setItem(row, 5, make_table_item(role))
-            self.students_table.setItem(row, 6, make_table_item(shirt))
-            self.students_table.setItem(row, 7, make_table_item(shoe))
-            self.students_table.setItem(row, 8, make_table_item("Yes" if active == 1 else "No"))
-            self.students_table.setItem(row, 9, make_table_item("YES" if eligible else "NO", align_center=True))
-
-        self.students_table.resizeColumnsToContents()
-        self.update_status(f"Loaded {len(rows)} students")
-        self.rebuild_completers()
-
-    def jump_to_student(self):
-        sid = self.find_id.text().strip()
-        if not sid.isdigit():
-            self.show_error("Enter a valid numeric ID")
-            return
-        for r in range(self.students_table.rowCount()):
-            if self.students_table.item(r, 0).text() == sid:
-                self.students_table.selectRow(r)
-                self.students_table.scrollToItem(self.students_table.item(r, 0), QAbstractItemView.PositionAtCenter)
-                return
-        self.show_error("Student not found in current view")
-
-    def on_student_selected(self):
-        row = self.students_table.currentRow()
-        if row < 0:
-            self.edit_id_readonly.clear()
-            self.edit_save.setEnabled(False)
-            return
-
-        sid = int(self.students_table.item(row, 0).text())
-        cur = self.conn.execute("""
-            SELECT STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''), COALESCE(PRIMARY_ROLE,''),
-                   COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1)
-            FROM STUDENTS
-            WHERE STUDENT_ID=?
-        """, (sid,))
-        s = cur.fetchone()
-        if not s:
-            return
-
-        self.edit_id_readonly.setText(str(s[0]))
-        self.edit_first.setText(s[1])
-        self.edit_last.setText(s[2])
-
-        self.edit_class.setCurrentText(s[3] if s[3] in CLASSIFICATIONS else "")
-        self.edit_section.setCurrentText(s[4] if s[4] in SECTIONS else "OTHER")
-
-        role_texts = [self.edit_role.itemText(i) for i in range(self.edit_role.count())]
-        self.edit_role.setCurrentText(s[5] if s[5] in role_texts else "")
-
-        self.edit_shirt.setCurrentText(s[6] if s[6] in SHIRT_SIZES else "")
-        self.edit_shoe.setCurrentText(s[7] if s[7] in SHOE_SIZES else "")
-        self.edit_active.setChecked(True if s[8] == 1 else False)
-
-        self.edit_save.setEnabled(True)
-
-    def add_student(self):
-        ok_id = self.validate_required(self.add_id)
-        ok_fn = bool(self.add_first.text().strip())
-        ok_ln = bool(self.add_last.text().strip())
-
-        if not ok_id:
-            self.show_error("Student ID is required")
-            return
-        if not ok_fn or not ok_ln:
-            self.show_error("First and Last name are required")
-            return
-
-        sid_txt = self.add_id.text().strip()
-        if not sid_txt.isdigit():
-            self.show_error("Student ID must be numeric")
-            self.add_id.setStyleSheet("border: 2px solid #e74c3c;")
-            return
-
-        sid = int(sid_txt)
-
-        if check_student_exists(self.conn, sid):
-            self.show_error("Student ID already exists")
-            self.add_id.setStyleSheet("border: 2px solid #e74c3c;")
-            return
-
-        fn = self.add_first.text().strip()
-        ln = self.add_last.text().strip()
-        cl = self.add_class.currentText()
-        sec = self.add_section.currentText()
-        role = self.add_role.currentText().strip() or None
-        shirt = self.add_shirt.currentText().strip() or None
-        shoe = self.add_shoe.currentText().strip() or None
-        active = 1 if self.add_active.isChecked() else 0
-        updated = date.today().isoformat()
-
-        ops = [
-            ("INSERT INTO STUDENTS (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-             (sid, fn, ln, cl, sec, role, shirt, shoe, active, updated)),
-            ("INSERT OR IGNORE INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, 0, 0.0, 0, ?)",
-             (sid, updated))
-        ]
-        undo_ops = [
-            ("DELETE FROM STUDENTS WHERE STUDENT_ID=?", (sid,))
-        ]
-
-        try:
-            self.conn.execute("BEGIN")
-            for sql, params in ops:
-                self.conn.execute(sql, params)
-            self.conn.commit()
-            self.push_undo_ops("Add Student", undo_ops)
-
-            self.add_id.clear()
-            self.add_first.clear()
-            self.add_last.clear()
-            self.add_class.setCurrentIndex(0)
-            self.add_section.setCurrentIndex(0)
-            self.add_role.setCurrentIndex(0)
-            self.add_shirt.setCurrentIndex(0)
-            self.add_shoe.setCurrentIndex(0)
-            self.add_active.setChecked(True)
-
-            self.refresh_all()
-            self.update_status("Student added")
-        except Exception as e:
-            self.conn.rollback()
-            self.show_error(f"Error: {str(e)}")
-
-    def save_student_edits(self):
-        sid_txt = self.edit_id_readonly.text().strip()
-        if not sid_txt.isdigit():
-            return
-        sid = int(sid_txt)
-
-        fn = self.edit_first.text().strip()
-        ln = self.edit_last.text().strip()
-        if not fn or not ln:
-            self.show_error("First and Last name are required")
-            return
-
-        cl = self.edit_class.currentText()
-        sec = self.edit_section.currentText()
-        role = self.edit_role.currentText().strip() or None
-        shirt = self.edit_shirt.currentText().strip() or None
-        shoe = self.edit_shoe.currentText().strip() or None
-        active = 1 if self.edit_active.isChecked() else 0
-        updated = date.today().isoformat()
-
-        cur = self.conn.execute("""
-            SELECT FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''), COALESCE(PRIMARY_ROLE,''),
-                   COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
-            FROM STUDENTS WHERE STUDENT_ID=?
-        """, (sid,))
-        old = cur.fetchone()
-        if not old:
-            return
-
-        ops = [
-            ("UPDATE STUDENTS SET FNAME=?, LNAME=?, CLASSIFICATION=?, SECTION=?, PRIMARY_ROLE=?, SHIRT_SIZE=?, SHOE_SIZE=?, ACTIVE=?, UPDATED_AT=? WHERE STUDENT_ID=?",
-             (fn, ln, cl, sec, role, shirt, shoe, active, updated, sid))
-        ]
-        undo_ops = [
-            ("UPDATE STUDENTS SET FNAME=?, LNAME=?, CLASSIFICATION=?, SECTION=?, PRIMARY_ROLE=?, SHIRT_SIZE=?, SHOE_SIZE=?, ACTIVE=?, UPDATED_AT=? WHERE STUDENT_ID=?",
-             (old[0], old[1], old[2], old[3], old[4] or None, old[5] or None, old[6] or None, old[7], old[8], sid))
-        ]
-
-        try:
-            self.conn.execute("BEGIN")
-            for sql, params in ops:
-                self.conn.execute(sql, params)
-            self.conn.commit()
-            self.push_undo_ops("Edit Student", undo_ops)
-            self.refresh_all()
-            self.update_status("Student updated")
-        except Exception as e:
-            self.conn.rollback()
-            self.show_error(f"Error: {str(e)}")
-
-    def delete_student(self):
-        row = self.students_table.currentRow()
-        if row < 0:
-            self.show_error("Select a student first")
-            return
-
-        sid = int(self.students_table.item(row, 0).text())
-        name = f"{self.students_table.item(row, 1).text()} {self.students_table.item(row, 2).text()}"
-
-        if not self.ask_yes_no("Confirm Delete", f"Delete {name} (ID: {sid})?"):
-            return
-
-        cur = self.conn.execute("""
-            SELECT STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''), COALESCE(PRIMARY_ROLE,''),
-                   COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
-            FROM STUDENTS WHERE STUDENT_ID=?
-        """, (sid,))
-        student = cur.fetchone()
-
-        cur = self.conn.execute("""
-            SELECT STUDENT_ID, COALESCE(CREDIT_HOURS,0), COALESCE(GPA,0.0), COALESCE(DUES_PAID,0), COALESCE(LAST_VERIFIED_DATE,'')
-            FROM COMPLIANCE WHERE STUDENT_ID=?
-        """, (sid,))
-        compliance = cur.fetchone()
-
-        cur = self.conn.execute("SELECT INSTRUMENT_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'') FROM INSTRUMENTS WHERE CHECKED_OUT_TO=?", (sid,))
-        instr_hold = cur.fetchone()
-
-        cur = self.conn.execute("SELECT UNIFORM_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'') FROM UNIFORMS WHERE CHECKED_OUT_TO=?", (sid,))
-        uni_hold = cur.fetchone()
-
-        cur = self.conn.execute("SELECT SHAKO_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'') FROM SHAKOS WHERE CHECKED_OUT_TO=?", (sid,))
-        shako_hold = cur.fetchone()
-
-        undo_ops = []
-
-        if student:
-            undo_ops.append((
-                "INSERT INTO STUDENTS (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
-                "ON CONFLICT(STUDENT_ID) DO UPDATE SET FNAME=excluded.FNAME, LNAME=excluded.LNAME, CLASSIFICATION=excluded.CLASSIFICATION, SECTION=excluded.SECTION, PRIMARY_ROLE=excluded.PRIMARY_ROLE, SHIRT_SIZE=excluded.SHIRT_SIZE, SHOE_SIZE=excluded.SHOE_SIZE, ACTIVE=excluded.ACTIVE, UPDATED_AT=excluded.UPDATED_AT",
-                (student[0], student[1], student[2], student[3], student[4], student[5] or None, student[6] or None, student[7] or None, student[8], student[9])
-            ))
-
-        if compliance:
-            undo_ops.append((
-                "INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
-                "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
-                (compliance[0], compliance[1], compliance[2], compliance[3], compliance[4])
-            ))
-
-        if instr_hold:
-            undo_ops.append((
-                "UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE INSTRUMENT_ID=?",
-                (sid, instr_hold[1] or None, instr_hold[2] or None, instr_hold[0])
-            ))
-
-        if uni_hold:
-            undo_ops.append((
-                "UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE UNIFORM_ID=?",
-                (sid, uni_hold[1] or None, uni_hold[2] or None, uni_hold[0])
-            ))
-
-        if shako_hold:
-            undo_ops.append((
-                "UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE SHAKO_ID=?",
-                (sid, shako_hold[1] or None, shako_hold[2] or None, shako_hold[0])
-            ))
-
-        try:
-            self.conn.execute("DELETE FROM STUDENTS WHERE STUDENT_ID=?", (sid,))
-            self.conn.commit()
-            self.push_undo_ops("Delete Student", undo_ops)
-            self.refresh_all()
-            self.update_status("Student deleted")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    # UNIFORM MENU
-    def create_uniforms_tab(self):
-        tab = QWidget()
-        self.tabs.addTab(tab, "Uniforms")
-        layout = QVBoxLayout(tab)
-
-        layout.setSpacing(6)
-        layout.setContentsMargins(6, 6, 6, 6)
-
-        top = QHBoxLayout()
-        self.uniform_search = QLineEdit()
-        self.uniform_search.setPlaceholderText("Search uniforms…")
-        self.uniform_search.textChanged.connect(self.load_uniforms)
-        top.addWidget(self.uniform_search)
-
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_uniforms)
-        top.addWidget(refresh_btn)
-        layout.addLayout(top)
-
-       
-        self.uniforms_table = QTableWidget(0, 9)
-        self.uniforms_table.setHorizontalHeaderLabels([
-            "ID", "Coat Size", "Pant Size", "Coat #", "Pant #",
-            "Condition", "Assigned To", "Date", "Available"
-        ])
-        self.uniforms_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.uniforms_table.setAlternatingRowColors(True)
-        self.uniforms_table.verticalHeader().setVisible(False)
-        self.uniforms_table.horizontalHeader().setStretchLastSection(True)
-        self.uniforms_table.setWordWrap(False)
-        self.uniforms_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.uniforms_table.setShowGrid(True)
-        layout.addWidget(self.uniforms_table)
-
-        forms_row = QHBoxLayout()
-        forms_row.setSpacing(12)
-
-        add_card = QFrame()
-        add_card.setObjectName("card")
-        add_card_layout = QVBoxLayout(add_card)
-        add_card_layout.setContentsMargins(12, 12, 12, 12)
-
-        add_group = QGroupBox("Add Uniform")
-        add_group.setStyleSheet("border: none;")  
-        add_form = QFormLayout(add_group)
-
-        self.coat_size = QLineEdit()
-        add_form.addRow("Coat Size:", self.coat_size)
-
-        self.pant_size = QLineEdit()
-        add_form.addRow("Pant Size:", self.pant_size)
-
-        self.coat_number = QLineEdit()
-        add_form.addRow("Coat #:", self.coat_number)
-
-        self.pant_number = QLineEdit()
-        add_form.addRow("Pant #:", self.pant_number)
-
-        self.uniform_condition = QLineEdit()
-        add_form.addRow("Condition:", self.uniform_condition)
-
-        add_btn = QPushButton("Add")
-        add_btn.clicked.connect(self.add_uniform)
-        add_form.addRow(add_btn)
-
-        add_card_layout.addWidget(add_group)
-        self.apply_shadow(add_card)
-
-        assign_card = QFrame()
-        assign_card.setObjectName("card")
-        assign_card_layout = QVBoxLayout(assign_card)
-        assign_card_layout.setContentsMargins(12, 12, 12, 12)
-
-        assign_group = QGroupBox("Assign / Unassign")
-        assign_group.setStyleSheet("border: none;")
-        assign_form = QFormLayout(assign_group)
-
-        self.assign_uni_student = QLineEdit()
-        self.assign_uni_student.setPlaceholderText("Student ID")
-        self.assign_uni_student.textChanged.connect(
-            lambda: self.show_student_preview(self.assign_uni_student, self.uni_preview)
-        )
-        assign_form.addRow("Student ID*:", self.assign_uni_student)
-
-        self.uni_preview = QLabel("")
-        assign_form.addRow("Student:", self.uni_preview)
-
-        assign_btn = QPushButton("Assign")
-        assign_btn.clicked.connect(self.assign_uniform)
-        assign_form.addRow(assign_btn)
-
-        unassign_btn = QPushButton("Unassign")
-        unassign_btn.clicked.connect(self.unassign_uniform)
-        assign_form.addRow(unassign_btn)
-
-        assign_card_layout.addWidget(assign_group)
-        self.apply_shadow(assign_card)
-
-        forms_row.addWidget(add_card)
-        forms_row.addWidget(assign_card)
-        layout.addLayout(forms_row)
-
-    def load_uniforms(self):
-        q = self.uniform_search.text().strip()
-        where = ""
-        params = []
-        if q:
-            where = """WHERE COALESCE(COAT_SIZE,'') LIKE ? OR COALESCE(PANT_SIZE,'') LIKE ?
-                       OR COALESCE(COAT_NUMBER,'') LIKE ? OR COALESCE(PANT_NUMBER,'') LIKE ?
-                       OR COALESCE(CONDITION_NOTES,'') LIKE ? OR COALESCE(CHECKED_OUT_TO,'') LIKE ?"""
-            params = [f"%{q}%"] * 6
-
-        cur = self.conn.execute(f"""
-            SELECT UNIFORM_ID, COALESCE(COAT_SIZE,''), COALESCE(PANT_SIZE,''),
-                   COALESCE(COAT_NUMBER,''), COALESCE(PANT_NUMBER,''),
-                   COALESCE(CONDITION_NOTES,''),
-                   COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-            FROM UNIFORMS
-            {where}
-            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID
-        """, params)
-
-        self.uniforms_table.setRowCount(0)
-        for r in cur.fetchall():
-            row = self.uniforms_table.rowCount()
-            self.uniforms_table.insertRow(row)
-            for c in range(9):
-                self.uniforms_table.setItem(row, c, make_table_item(r[c]))
-
-        self.uniforms_table.resizeColumnsToContents()
-        self.update_status(f"Loaded {self.uniforms_table.rowCount()} uniforms")
-
-    def add_uniform(self):
-        coat = self.coat_size.text().strip() or None
-        pant = self.pant_size.text().strip() or None
-        coatn = self.coat_number.text().strip() or None
-        pantn = self.pant_number.text().strip() or None
-        cond = self.uniform_condition.text().strip() or None
-
-        try:
-            self.conn.execute(
-                "INSERT INTO UNIFORMS (COAT_SIZE, PANT_SIZE, COAT_NUMBER, PANT_NUMBER, CONDITION_NOTES) VALUES (?, ?, ?, ?, ?)",
-                (coat, pant, coatn, pantn, cond)
-            )
-            uid = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-            self.conn.commit()
-            self.push_undo_ops("Add Uniform", [("DELETE FROM UNIFORMS WHERE UNIFORM_ID=?", (uid,))])
-
-            self.coat_size.clear()
-            self.pant_size.clear()
-            self.coat_number.clear()
-            self.pant_number.clear()
-            self.uniform_condition.clear()
-
-            self.refresh_all()
-            self.update_status("Uniform added")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def get_selected_uniform_id(self):
-        row = self.uniforms_table.currentRow()
-        if row < 0:
-            return None
-        return int(self.uniforms_table.item(row, 0).text())
-
-    def show_student_preview(self, field, label):
-        txt = field.text().strip()
-        if txt.isdigit() and check_student_exists(self.conn, int(txt)):
-            label.setText(get_student_name(self.conn, int(txt)))
-        else:
-            label.setText("")
-
-    def assign_uniform(self):
-        uid = self.get_selected_uniform_id()
-        if not uid:
-            self.show_error("Select a uniform first")
-            return
-
-        if not self.validate_required(self.assign_uni_student):
-            self.show_error("Student ID is required")
-            return
-
-        sid_txt = self.assign_uni_student.text().strip()
-        if not sid_txt.isdigit():
-            self.show_error("Student ID must be numeric")
-            return
-        sid = int(sid_txt)
-
-        if not check_student_exists(self.conn, sid):
-            self.show_error("Student not found")
-            return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM UNIFORMS WHERE UNIFORM_ID=?", (uid,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if old_to:
-            self.show_error("That uniform is already assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition", "Condition notes (optional):")
-        if not ok:
-            return
-
-        try:
-            self.conn.execute("""
-                UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=?
-                WHERE UNIFORM_ID=? AND CHECKED_OUT_TO IS NULL
-            """, (sid, date.today().isoformat(), cond.strip() or old_cond or None, uid))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE UNIFORM_ID=?",
-                         (old_to, old_date, old_cond or None, uid))]
-            self.push_undo_ops("Assign Uniform", undo_ops)
-
-            self.assign_uni_student.clear()
-            self.uni_preview.setText("")
-            self.refresh_all()
-            self.update_status("Uniform assigned")
-        except sqlite3.IntegrityError:
-            self.show_error("Student can only hold one uniform")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def unassign_uniform(self):
-        uid = self.get_selected_uniform_id()
-        if not uid:
-            self.show_error("Select a uniform first")
-            return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM UNIFORMS WHERE UNIFORM_ID=?", (uid,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if not old_to:
-            self.show_error("That uniform is not assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition Update", "Condition notes after return (optional):")
-        if not ok:
-            return
-
-        new_cond = cond.strip() or old_cond or None
-
-        try:
-            self.conn.execute("""
-                UPDATE UNIFORMS SET CHECKED_OUT_TO=NULL, CHECKED_OUT_DATE=NULL, CONDITION_NOTES=?
-                WHERE UNIFORM_ID=?
-            """, (new_cond, uid))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE UNIFORM_ID=?",
-                         (old_to, old_date, old_cond or None, uid))]
-            self.push_undo_ops("Unassign Uniform", undo_ops)
-
-            self.refresh_all()
-            self.update_status("Uniform unassigned")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    # SHAKO MENU
-    def create_shakos_tab(self):
-        tab = QWidget()
-        self.tabs.addTab(tab, "Shakos")
-        layout = QVBoxLayout(tab)
-
-        top = QHBoxLayout()
-        self.shako_search = QLineEdit()
-        self.shako_search.setPlaceholderText("Search shakos…")
-        self.shako_search.textChanged.connect(self.load_shakos)
-        top.addWidget(self.shako_search)
-
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_shakos)
-        top.addWidget(refresh_btn)
-        layout.addLayout(top)
-
-        self.shakos_table = QTableWidget(0, 6)
-        self.shakos_table.setHorizontalHeaderLabels([
-            "ID", "Size", "Condition", "Assigned To", "Date", "Available"
-        ])
-        self.shakos_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.shakos_table.setAlternatingRowColors(True)
-        self.shakos_table.verticalHeader().setVisible(False)
-        self.shakos_table.horizontalHeader().setStretchLastSection(True)
-        self.shakos_table.setWordWrap(False)
-        self.shakos_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.shakos_table.setShowGrid(True)
-        layout.addWidget(self.shakos_table)
-
-        forms_row = QHBoxLayout()
-
-        add_group = QGroupBox("Add Shako")
-        add_form = QFormLayout(add_group)
-
-        self.shako_size = QLineEdit()
-        add_form.addRow("Size:", self.shako_size)
-
-        self.shako_condition = QLineEdit()
-        add_form.addRow("Condition:", self.shako_condition)
-
-        add_btn = QPushButton("Add")
-        add_btn.clicked.connect(self.add_shako)
-        add_form.addRow(add_btn)
-
-        assign_group = QGroupBox("Assign / Unassign")
-        assign_form = QFormLayout(assign_group)
-
-        self.assign_shako_student = QLineEdit()
-        self.assign_shako_student.setPlaceholderText("Student ID")
-        self.assign_shako_student.textChanged.connect(lambda: self.show_student_preview(self.assign_shako_student, self.shako_preview))
-        assign_form.addRow("Student ID*:", self.assign_shako_student)
-
-        self.shako_preview = QLabel("")
-        assign_form.addRow("Student:", self.shako_preview)
-
-        assign_btn = QPushButton("Assign")
-        assign_btn.clicked.connect(self.assign_shako)
-        assign_form.addRow(assign_btn)
-
-        unassign_btn = QPushButton("Unassign")
-        unassign_btn.clicked.connect(self.unassign_shako)
-        assign_form.addRow(unassign_btn)
-
-        forms_row.addWidget(add_group)
-        forms_row.addWidget(assign_group)
-        layout.addLayout(forms_row)
-
-        self.apply_shadow(add_group)
-        self.apply_shadow(assign_group)
-
-    def load_shakos(self):
-        q = self.shako_search.text().strip()
-        where = ""
-        params = []
-        if q:
-            where = "WHERE COALESCE(SIZE,'') LIKE ? OR COALESCE(CONDITION_NOTES,'') LIKE ? OR COALESCE(CHECKED_OUT_TO,'') LIKE ?"
-            params = [f"%{q}%"] * 3
-
-        cur = self.conn.execute(f"""
-            SELECT SHAKO_ID, COALESCE(SIZE,''), COALESCE(CONDITION_NOTES,''),
-                   COALESCE(CHECKED_OUT_TO,''), COALESCE(CHECKED_OUT_DATE,''),
-                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-            FROM SHAKOS
-            {where}
-            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID
-        """, params)
-
-        self.shakos_table.setRowCount(0)
-        for r in cur.fetchall():
-            row = self.shakos_table.rowCount()
-            self.shakos_table.insertRow(row)
-            for c in range(6):
-                self.shakos_table.setItem(row, c, make_table_item(r[c]))
-
-        self.shakos_table.resizeColumnsToContents()
-        self.update_status(f"Loaded {self.shakos_table.rowCount()} shakos")
-
-    def add_shako(self):
-        size = self.shako_size.text().strip() or None
-        cond = self.shako_condition.text().strip() or None
-        try:
-            self.conn.execute("INSERT INTO SHAKOS (SIZE, CONDITION_NOTES) VALUES (?, ?)", (size, cond))
-            sid = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-            self.conn.commit()
-            self.push_undo_ops("Add Shako", [("DELETE FROM SHAKOS WHERE SHAKO_ID=?", (sid,))])
-
-            self.shako_size.clear()
-            self.shako_condition.clear()
-
-            self.refresh_all()
-            self.update_status("Shako added")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def get_selected_shako_id(self):
-        row = self.shakos_table.currentRow()
-        if row < 0:
-            return None
-        return int(self.shakos_table.item(row, 0).text())
-
-    def assign_shako(self):
-        shako_id = self.get_selected_shako_id()
-        if not shako_id:
-            self.show_error("Select a shako first")
-            return
-
-        if not self.validate_required(self.assign_shako_student):
-            self.show_error("Student ID is required")
-            return
-
-        sid_txt = self.assign_shako_student.text().strip()
-        if not sid_txt.isdigit():
-            self.show_error("Student ID must be numeric")
-            return
-        sid = int(sid_txt)
-
-        if not check_student_exists(self.conn, sid):
-            self.show_error("Student not found")
-            return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM SHAKOS WHERE SHAKO_ID=?", (shako_id,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if old_to:
-            self.show_error("That shako is already assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition", "Condition notes (optional):")
-        if not ok:
-            return
-
-        try:
-            self.conn.execute("""
-                UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=?
-                WHERE SHAKO_ID=? AND CHECKED_OUT_TO IS NULL
-            """, (sid, date.today().isoformat(), cond.strip() or old_cond or None, shako_id))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE SHAKO_ID=?",
-                         (old_to, old_date, old_cond or None, shako_id))]
-            self.push_undo_ops("Assign Shako", undo_ops)
-
-            self.assign_shako_student.clear()
-            self.shako_preview.setText("")
-            self.refresh_all()
-            self.update_status("Shako assigned")
-        except sqlite3.IntegrityError:
-            self.show_error("Student can only hold one shako")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def unassign_shako(self):
-        shako_id = self.get_selected_shako_id()
-        if not shako_id:
-            self.show_error("Select a shako first")
-            return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM SHAKOS WHERE SHAKO_ID=?", (shako_id,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if not old_to:
-            self.show_error("That shako is not assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition Update", "Condition notes after return (optional):")
-        if not ok:
-            return
-
-        new_cond = cond.strip() or old_cond or None
-
-        try:
-            self.conn.execute("""
-                UPDATE SHAKOS SET CHECKED_OUT_TO=NULL, CHECKED_OUT_DATE=NULL, CONDITION_NOTES=?
-                WHERE SHAKO_ID=?
-            """, (new_cond, shako_id))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE SHAKO_ID=?",
-                         (old_to, old_date, old_cond or None, shako_id))]
-            self.push_undo_ops("Unassign Shako", undo_ops)
-
-            self.refresh_all()
-            self.update_status("Shako unassigned")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    # INSTRUMENT MENU
-    def create_instruments_tab(self):
-        tab = QWidget()
-        self.tabs.addTab(tab, "Instruments")
-        layout = QVBoxLayout(tab)
-
-        top = QHBoxLayout()
-        self.instrument_search = QLineEdit()
-        self.instrument_search.setPlaceholderText("Search instruments… (type, serial, condition, assigned ID)")
-        self.instrument_search.textChanged.connect(self.load_instruments)
-        top.addWidget(self.instrument_search)
-
-        self.section_filter = QComboBox()
-        self.section_filter.addItems(["All Sections", "WOODWIND", "BRASS", "PERCUSSION"])
-        self.section_filter.currentIndexChanged.connect(self.load_instruments)
-        top.addWidget(self.section_filter)
-
-        refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_instruments)
-        top.addWidget(refresh_btn)
-
-        layout.addLayout(top)
-
-        self.instruments_table = QTableWidget(0, 8)
-        self.instruments_table.setHorizontalHeaderLabels([
-            "ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"
-        ])
-        self.instruments_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.instruments_table.setAlternatingRowColors(True)
-        self.instruments_table.verticalHeader().setVisible(False)
-        self.instruments_table.horizontalHeader().setStretchLastSection(True)
-        self.instruments_table.setWordWrap(False)
-        self.instruments_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
-        self.instruments_table.setShowGrid(True)
-        layout.addWidget(self.instruments_table)
-
-        forms_row = QHBoxLayout()
-
-        add_group = QGroupBox("Add Instrument")
-        add_form = QFormLayout(add_group)
-
-        self.instrument_type_combo = QComboBox()
-        self.load_instrument_types()
-        add_form.addRow("Type*:", self.instrument_type_combo)
-
-        self.instrument_serial = QLineEdit()
-        add_form.addRow("Serial #:", self.instrument_serial)
-
-        self.instrument_notes = QLineEdit()
-        add_form.addRow("Condition:", self.instrument_notes)
-
-        add_btn = QPushButton("Add")
-        add_btn.clicked.connect(self.add_instrument)
-        add_form.addRow(add_btn)
-
-        assign_group = QGroupBox("Assign / Unassign")
-        assign_form = QFormLayout(assign_group)
-
-        self.assign_instr_student = QLineEdit()
-        self.assign_instr_student.setPlaceholderText("Student ID")
-        self.assign_instr_student.textChanged.connect(lambda: self.show_student_preview(self.assign_instr_student, self.instr_preview))
-        assign_form.addRow("Student ID*:", self.assign_instr_student)
-
-        self.instr_preview = QLabel("")
-        assign_form.addRow("Student:", self.instr_preview)
-
-        assign_btn = QPushButton("Assign")
-        assign_btn.clicked.connect(self.assign_instrument)
-        assign_form.addRow(assign_btn)
-
-        unassign_btn = QPushButton("Unassign")
-        unassign_btn.clicked.connect(self.unassign_instrument)
-        assign_form.addRow(unassign_btn)
-
-        forms_row.addWidget(add_group)
-        forms_row.addWidget(assign_group)
-        layout.addLayout(forms_row)
-
-        self.apply_shadow(add_group)
-        self.apply_shadow(assign_group)
-
-    def load_instrument_types(self):
-        self.instrument_type_combo.clear()
-        cur = self.conn.execute("SELECT TYPE_ID, TYPE_NAME, SECTION FROM INSTRUMENT_TYPES ORDER BY SECTION, TYPE_NAME")
-        for tid, name, sec in cur.fetchall():
-            self.instrument_type_combo.addItem(f"{name} ({sec})", tid)
-
-    def load_instruments(self):
-        q = self.instrument_search.text().strip()
-        sec = self.section_filter.currentText()
-
-        where = []
-        params = []
-
-        if sec != "All Sections":
-            where.append("t.SECTION=?")
-            params.append(sec)
-
-        if q:
-            where.append("(t.TYPE_NAME LIKE ? OR COALESCE(i.SERIAL,'') LIKE ? OR COALESCE(i.CONDITION_NOTES,'') LIKE ? OR COALESCE(i.CHECKED_OUT_TO,'') LIKE ?)")
-            params.extend([f"%{q}%"] * 4)
-
-        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
-
-        cur = self.conn.execute(f"""
-            SELECT i.INSTRUMENT_ID, t.TYPE_NAME, t.SECTION,
-                   COALESCE(i.SERIAL,''), COALESCE(i.CONDITION_NOTES,''),
-                   COALESCE(i.CHECKED_OUT_TO,''), COALESCE(i.CHECKED_OUT_DATE,''),
-                   CASE WHEN i.CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
-            FROM INSTRUMENTS i
-            JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
-            {where_sql}
-            ORDER BY t.SECTION, t.TYPE_NAME, i.INSTRUMENT_ID
-        """, params)
-
-        self.instruments_table.setRowCount(0)
-        for r in cur.fetchall():
-            row = self.instruments_table.rowCount()
-            self.instruments_table.insertRow(row)
-            for c in range(8):
-                self.instruments_table.setItem(row, c, make_table_item(r[c]))
-
-        self.instruments_table.resizeColumnsToContents()
-        self.update_status(f"Loaded {self.instruments_table.rowCount()} instruments")
-
-    def add_instrument(self):
-        tid = self.instrument_type_combo.currentData()
-        if not tid:
-            self.show_error("Select a type")
-            return
-
-        serial = self.instrument_serial.text().strip() or None
-        cond = self.instrument_notes.text().strip() or None
-
-        try:
-            self.conn.execute("INSERT INTO INSTRUMENTS (TYPE_ID, SERIAL, CONDITION_NOTES) VALUES (?, ?, ?)", (tid, serial, cond))
-            iid = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
-            self.conn.commit()
-            self.push_undo_ops("Add Instrument", [("DELETE FROM INSTRUMENTS WHERE INSTRUMENT_ID=?", (iid,))])
-
-            self.instrument_serial.clear()
-            self.instrument_notes.clear()
-
-            self.refresh_all()
-            self.update_status("Instrument added")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def get_selected_instrument_id(self):
-        row = self.instruments_table.currentRow()
-        if row < 0:
-            return None
-        return int(self.instruments_table.item(row, 0).text())
-
-    def assign_instrument(self):
-        iid = self.get_selected_instrument_id()
-        if not iid:
-            self.show_error("Select an instrument first")
-            return
-
-        if not self.validate_required(self.assign_instr_student):
-            self.show_error("Student ID is required")
-            return
-
-        sid_txt = self.assign_instr_student.text().strip()
-        if not sid_txt.isdigit():
-            self.show_error("Student ID must be numeric")
-            return
-        sid = int(sid_txt)
-
-        if not check_student_exists(self.conn, sid):
-            self.show_error("Student not found")
-            return
-
-        instr_section = get_instrument_section_by_id(self.conn, iid)
-        student_section = get_student_section(self.conn, sid)
-        if instr_section and student_section and instr_section != student_section:
-            if not self.ask_yes_no("Section mismatch", f"Instrument section is {instr_section} but student section is {student_section}. Assign anyway?"):
-                return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM INSTRUMENTS WHERE INSTRUMENT_ID=?", (iid,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if old_to:
-            self.show_error("That instrument is already assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition", "Condition notes (optional):")
-        if not ok:
-            return
-
-        try:
-            self.conn.execute("""
-                UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=?
-                WHERE INSTRUMENT_ID=? AND CHECKED_OUT_TO IS NULL
-            """, (sid, date.today().isoformat(), cond.strip() or old_cond or None, iid))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE INSTRUMENT_ID=?",
-                         (old_to, old_date, old_cond or None, iid))]
-            self.push_undo_ops("Assign Instrument", undo_ops)
-
-            self.assign_instr_student.clear()
-            self.instr_preview.setText("")
-            self.refresh_all()
-            self.update_status("Instrument assigned")
-        except sqlite3.IntegrityError:
-            self.show_error("Student can only hold one instrument")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def unassign_instrument(self):
-        iid = self.get_selected_instrument_id()
-        if not iid:
-            self.show_error("Select an instrument first")
-            return
-
-        cur = self.conn.execute("SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM INSTRUMENTS WHERE INSTRUMENT_ID=?", (iid,))
-        old_to, old_date, old_cond = cur.fetchone()
-
-        if not old_to:
-            self.show_error("That instrument is not assigned")
-            return
-
-        cond, ok = QInputDialog.getText(self, "Condition Update", "Condition notes after return (optional):")
-        if not ok:
-            return
-
-        new_cond = cond.strip() or old_cond or None
-
-        try:
-            self.conn.execute("""
-                UPDATE INSTRUMENTS SET CHECKED_OUT_TO=NULL, CHECKED_OUT_DATE=NULL, CONDITION_NOTES=?
-                WHERE INSTRUMENT_ID=?
-            """, (new_cond, iid))
-            self.conn.commit()
-
-            undo_ops = [("UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE INSTRUMENT_ID=?",
-                         (old_to, old_date, old_cond or None, iid))]
-            self.push_undo_ops("Unassign Instrument", undo_ops)
-
-            self.refresh_all()
-            self.update_status("Instrument unassigned")
-        except Exception as e:
-            self.show_error(f"Error: {str(e)}")
-
-    def refresh_all(self):
-        self.load_students()
-        self.load_uniforms()
-        self.load_shakos()
-        self.load_instruments()
-
-def seed_sample_data(conn):
-        """
-        Inserts sample data ONLY if the database is empty.
-        """
-        cur = conn.execute("SELECT COUNT(*) FROM STUDENTS")
-        if cur.fetchone()[0] > 0:
-            return  
-
-        # Students 
-        students = [
-            (300819037, "Jordan", "Reed", "Freshman", "WOODWIND", "CLARINET", "M", "9",   1),
-            (300612467, "Ava",    "Lopez","Sophomore","BRASS",   "TRUMPET",  "S", "7.5", 1),
-            (300395193, "Miles",  "King", "Junior",   "PERCUSSION","SNARE DRUM","L","11",1),
-            (300518905, "Nia",    "Carter","Senior",  "FLAG CORP","OTHER",   "M", "8",   1),
-            (300135890, "Ethan",  "Park", "Junior",   "BRASS",   "TROMBONE", "XL","12",  1),
-            (300131935, "Zoe",    "Smith","Freshman", "WOODWIND","FLUTE",    "XS","6.5", 0),  
-        ]
-
-        today = date.today().isoformat()
-
-        conn.execute("BEGIN")
-
-        # Insert students
-        for sid, fn, ln, cl, sec, role, shirt, shoe, active in students:
-            conn.execute(
-                """INSERT INTO STUDENTS
-                (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (sid, fn, ln, cl, sec, role, shirt, shoe, active, today)
-            )
-
-        # Compliance
-        compliance = [
-            (300819037, 14, 3.20, 1, today),  # eligible
-            (300612467, 12, 2.85, 1, today),  # not eligible (gpa)
-            (300395193, 10, 3.50, 1, today),  # not eligible (credits)
-            (300518905, 15, 3.10, 0, today),  # not eligible (dues)
-            (300135890, 16, 3.70, 1, today),  # eligible
-            (300131935, 0,  0.00, 0, today),
-        ]
-        for row in compliance:
-            conn.execute(
-                """INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE)
-                VALUES (?, ?, ?, ?, ?)""",
-                row
-            )
-
-        # Instruments
-        type_id = {name: tid for tid, name in conn.execute("SELECT TYPE_ID, TYPE_NAME FROM INSTRUMENT_TYPES")}
-        instruments = [
-            (type_id["CLARINET"], "CL-44321", "Good pads"),
-            (type_id["TRUMPET"], "TR-88210", "Valve 2 sticky"),
-            (type_id["SNARE DRUM"], "SD-11007", "New head"),
-            (type_id["TROMBONE"], "TB-23001", "Slide a bit tight"),
-        ]
-        for tid, serial, notes in instruments:
-            conn.execute(
-                "INSERT INTO INSTRUMENTS (TYPE_ID, SERIAL, CONDITION_NOTES) VALUES (?, ?, ?)",
-                (tid, serial, notes)
-            )
-
-        
-        instr_ids = [r[0] for r in conn.execute("SELECT INSTRUMENT_ID FROM INSTRUMENTS ORDER BY INSTRUMENT_ID").fetchall()]
-    
-        conn.execute("UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=? WHERE INSTRUMENT_ID=?",
-                    (300819037, today, instr_ids[0]))
-        conn.execute("UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=? WHERE INSTRUMENT_ID=?",
-                    (300612467, today, instr_ids[1]))
-
-        # Uniforms
-        uniforms = [
-            ("40R", "32", "C-101", "P-101", "Clean"),
-            ("38R", "30", "C-102", "P-102", "Minor tear"),
-            ("42L", "34", "C-103", "P-103", "Needs dry clean"),
-        ]
-        for coat, pant, coatn, pantn, notes in uniforms:
-            conn.execute(
-                "INSERT INTO UNIFORMS (COAT_SIZE, PANT_SIZE, COAT_NUMBER, PANT_NUMBER, CONDITION_NOTES) VALUES (?, ?, ?, ?, ?)",
-                (coat, pant, coatn, pantn, notes)
-            )
-
-        uni_id = conn.execute("SELECT UNIFORM_ID FROM UNIFORMS ORDER BY UNIFORM_ID LIMIT 1").fetchone()[0]
-        conn.execute("UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=? WHERE UNIFORM_ID=?",
-                    (300395193, today, uni_id))
-
-        # Shakos
-        shakos = [
-            ("7 1/4", "Good"),
-            ("7 3/8", "Needs plume"),
-            ("7 1/2", "Scuffed brim"),
-        ]
-        for size, notes in shakos:
-            conn.execute("INSERT INTO SHAKOS (SIZE, CONDITION_NOTES) VALUES (?, ?)", (size, notes))
-
-        shako_id = conn.execute("SELECT SHAKO_ID FROM SHAKOS ORDER BY SHAKO_ID LIMIT 1").fetchone()[0]
-        conn.execute("UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=? WHERE SHAKO_ID=?",
-                    (300518905, today, shako_id))
-
-        conn.commit()
-
-
-def main():
-    app = QApplication(sys.argv)
-    app.setStyle("Fusion")
-
-    window = BandDatabaseApp()
-    window.resize(1280, 780)
-    window.show()
-
-    sys.exit(app.exec())
-
-if __name__ == "__main__":
-    main()
+import sys
+import os
+import csv
+import math
+import sqlite3
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from PySide6.QtCore import (
+    Qt, QSize, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, Signal, QSortFilterProxyModel,
+    QStringListModel, QDir, QTemporaryFile
+)
+from PySide6.QtGui import QAction, QImage, QPainter, QColor, QPen
+from PySide6.QtWidgets import (
+    QApplication, QWidget, QMainWindow, QVBoxLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox,
+    QTableView, QMessageBox, QGroupBox, QFormLayout,
+    QTabWidget, QFileDialog, QHeaderView, QInputDialog, QCheckBox,
+    QSplitter, QToolButton, QButtonGroup, QDialog, QAbstractItemView,
+    QCompleter, QStyle, QFrame
+)
+
+DB_PATH = "band.db"
+
+SECTIONS = ["WOODWIND", "BRASS", "PERCUSSION", "FLAG CORP", "DRUM MAJOR", "OTHER"]
+CLASSIFICATIONS = ["", "Freshman", "Sophomore", "Junior", "Senior", "Graduate"]
+SHIRT_SIZES = ["", "XS", "S", "M", "L", "XL", "XXL", "XXXL"]
+SHOE_SIZES = [""] + [str(x) for x in [
+    5, 5.5, 6, 6.5, 7, 7.5, 8, 8.5, 9, 9.5, 10, 10.5, 11, 11.5, 12, 12.5, 13, 13.5, 14, 14.5, 15
+]]
+
+INSTRUMENT_CATALOG = [
+    ("PICCOLO", "WOODWIND"),
+    ("FLUTE", "WOODWIND"),
+    ("CLARINET", "WOODWIND"),
+    ("ALTO SAXOPHONE", "WOODWIND"),
+    ("TENOR SAXOPHONE", "WOODWIND"),
+    ("BARITONE SAXOPHONE", "WOODWIND"),
+    ("TRUMPET", "BRASS"),
+    ("MELLOPHONE", "BRASS"),
+    ("TROMBONE", "BRASS"),
+    ("EUPHONIUM / BARITONE", "BRASS"),
+    ("SOUSAPHONE", "BRASS"),
+    ("SNARE DRUM", "PERCUSSION"),
+    ("TENOR DRUMS", "PERCUSSION"),
+    ("BASS DRUM", "PERCUSSION"),
+    ("CYMBALS", "PERCUSSION"),
+]
+
+def connect_db():
+    fresh_db = not os.path.exists(DB_PATH) or os.path.getsize(DB_PATH) == 0
+    # Autocommit: every write either runs standalone or inside an explicit
+    # BEGIN IMMEDIATE, so no deferred lock ever has to upgrade mid-handler.
+    conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+    conn.execute("PRAGMA foreign_keys = ON;")
+    if fresh_db:
+        # page_size only takes effect before the database is created and
+        # while still outside WAL mode.
+        conn.execute("PRAGMA page_size = 8192;")
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA cache_size = -16384;")       # 16 MB page cache
+    conn.execute("PRAGMA mmap_size = 268435456;")     # 256 MB memory-mapped I/O
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    return conn
+
+def table_info(conn, table):
+    cur = conn.execute(f"PRAGMA table_info({table})")
+    return cur.fetchall()
+
+# Per-connection cache of column-name sets so repeated schema probes don't
+# re-run PRAGMA table_info for the same table.
+_columns_cache = {}
+
+def existing_columns(conn, table):
+    key = (id(conn), table)
+    cols = _columns_cache.get(key)
+    if cols is None:
+        cols = {r[1] for r in table_info(conn, table)}
+        _columns_cache[key] = cols
+    return cols
+
+def invalidate_columns_cache(conn, table):
+    _columns_cache.pop((id(conn), table), None)
+
+def current_school_year_label():
+    today = date.today()
+    y = today.year
+    start = y if today.month >= 8 else y - 1
+    return f"{start}-{start+1}"
+
+# Set by create_tables once we know whether this SQLite build has FTS5.
+FTS_ENABLED = False
+
+def fts_match_query(q):
+    """Turn free text into an FTS5 prefix query: each word quoted with a * suffix."""
+    tokens = [t.replace('"', '') for t in q.split()]
+    return " ".join(f'"{t}"*' for t in tokens if t)
+
+def create_tables(conn):
+    # One explicit transaction for all DDL + catalog seeding: a single WAL
+    # commit at startup instead of one per statement.
+    conn.execute("BEGIN")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS STUDENTS (
+            STUDENT_ID INTEGER PRIMARY KEY,
+            FNAME TEXT NOT NULL,
+            LNAME TEXT NOT NULL,
+            CLASSIFICATION TEXT,
+            SECTION TEXT NOT NULL,
+            PRIMARY_ROLE TEXT,
+            SHIRT_SIZE TEXT,
+            SHOE_SIZE TEXT,
+            ACTIVE INTEGER NOT NULL DEFAULT 1,
+            UPDATED_AT TEXT
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS COMPLIANCE (
+            STUDENT_ID INTEGER PRIMARY KEY,
+            CREDIT_HOURS INTEGER NOT NULL DEFAULT 0,
+            GPA REAL NOT NULL DEFAULT 0.0,
+            DUES_PAID INTEGER NOT NULL DEFAULT 0,
+            LAST_VERIFIED_DATE TEXT,
+            FOREIGN KEY (STUDENT_ID) REFERENCES STUDENTS(STUDENT_ID) ON DELETE CASCADE
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS INSTRUMENT_TYPES (
+            TYPE_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            TYPE_NAME TEXT UNIQUE NOT NULL,
+            SECTION TEXT NOT NULL
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS INSTRUMENTS (
+            INSTRUMENT_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            TYPE_ID INTEGER NOT NULL,
+            SERIAL TEXT,
+            CONDITION_NOTES TEXT,
+            CHECKED_OUT_TO INTEGER UNIQUE,
+            CHECKED_OUT_DATE TEXT,
+            FOREIGN KEY (TYPE_ID) REFERENCES INSTRUMENT_TYPES(TYPE_ID) ON DELETE RESTRICT,
+            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS UNIFORMS (
+            UNIFORM_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            COAT_SIZE TEXT,
+            PANT_SIZE TEXT,
+            COAT_NUMBER TEXT,
+            PANT_NUMBER TEXT,
+            CONDITION_NOTES TEXT,
+            CHECKED_OUT_TO INTEGER UNIQUE,
+            CHECKED_OUT_DATE TEXT,
+            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS SHAKOS (
+            SHAKO_ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            SIZE TEXT,
+            CONDITION_NOTES TEXT,
+            CHECKED_OUT_TO INTEGER UNIQUE,
+            CHECKED_OUT_DATE TEXT,
+            FOREIGN KEY (CHECKED_OUT_TO) REFERENCES STUDENTS(STUDENT_ID) ON DELETE SET NULL
+        )
+    """)
+
+    # Backwards-safe schema upgrades (one table_info probe for all checks)
+    cols = existing_columns(conn, "STUDENTS")
+    altered = False
+    if "PRIMARY_ROLE" not in cols:
+        conn.execute("ALTER TABLE STUDENTS ADD COLUMN PRIMARY_ROLE TEXT")
+        altered = True
+    if "ACTIVE" not in cols:
+        conn.execute("ALTER TABLE STUDENTS ADD COLUMN ACTIVE INTEGER NOT NULL DEFAULT 1")
+        altered = True
+    if "UPDATED_AT" not in cols:
+        conn.execute("ALTER TABLE STUDENTS ADD COLUMN UPDATED_AT TEXT")
+        altered = True
+    if altered:
+        invalidate_columns_cache(conn, "STUDENTS")
+
+    # Full-text index over student names, kept in sync by triggers. LIKE
+    # '%q%' cannot use a B-tree index, so name search goes through FTS5.
+    global FTS_ENABLED
+    try:
+        fts_existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='STUDENTS_FTS'"
+        ).fetchone() is not None
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS STUDENTS_FTS USING fts5(
+                FNAME, LNAME, content='STUDENTS', content_rowid='STUDENT_ID'
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS STUDENTS_FTS_AI AFTER INSERT ON STUDENTS BEGIN
+                INSERT INTO STUDENTS_FTS(rowid, FNAME, LNAME)
+                VALUES (new.STUDENT_ID, new.FNAME, new.LNAME);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS STUDENTS_FTS_AD AFTER DELETE ON STUDENTS BEGIN
+                INSERT INTO STUDENTS_FTS(STUDENTS_FTS, rowid, FNAME, LNAME)
+                VALUES ('delete', old.STUDENT_ID, old.FNAME, old.LNAME);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS STUDENTS_FTS_AU AFTER UPDATE ON STUDENTS BEGIN
+                INSERT INTO STUDENTS_FTS(STUDENTS_FTS, rowid, FNAME, LNAME)
+                VALUES ('delete', old.STUDENT_ID, old.FNAME, old.LNAME);
+                INSERT INTO STUDENTS_FTS(rowid, FNAME, LNAME)
+                VALUES (new.STUDENT_ID, new.FNAME, new.LNAME);
+            END
+        """)
+        if not fts_existed:
+            # Index any rows that predate the FTS table (upgraded databases).
+            conn.execute("INSERT INTO STUDENTS_FTS(STUDENTS_FTS) VALUES('rebuild')")
+        # Prove the triggers are actually allowed to write to the virtual
+        # table under this connection's settings (trusted_schema=OFF raises
+        # "unsafe use of virtual table" on FTS5 builds).  A sentinel row
+        # inside a savepoint exercises all three triggers and leaves no trace.
+        conn.execute("SAVEPOINT fts_probe")
+        try:
+            conn.execute(
+                "INSERT INTO STUDENTS (STUDENT_ID, FNAME, LNAME, SECTION) VALUES (-1, 'x', 'x', 'BRASS')")
+            conn.execute("UPDATE STUDENTS SET FNAME='y' WHERE STUDENT_ID=-1")
+            conn.execute("DELETE FROM STUDENTS WHERE STUDENT_ID=-1")
+        finally:
+            conn.execute("ROLLBACK TO fts_probe")
+            conn.execute("RELEASE fts_probe")
+        FTS_ENABLED = True
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5, or trigger writes to the virtual table
+        # are rejected — drop the triggers so every STUDENTS write keeps
+        # working and searches fall back to LIKE.
+        for trg in ("STUDENTS_FTS_AI", "STUDENTS_FTS_AD", "STUDENTS_FTS_AU"):
+            conn.execute(f"DROP TRIGGER IF EXISTS {trg}")
+        FTS_ENABLED = False
+
+    # Secondary indexes so roster/inventory searches and sorts stay fast
+    # as the tables grow (the schema itself only has primary keys).
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_students_lname_fname ON STUDENTS(LNAME, FNAME)")
+    # idx_instruments_type already covers (TYPE_ID, INSTRUMENT_ID): every
+    # entry ends with the rowid, which IS the instrument id.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_instruments_type ON INSTRUMENTS(TYPE_ID)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_itypes_sec_name ON INSTRUMENT_TYPES(SECTION, TYPE_NAME)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_uniforms_checked ON UNIFORMS(CHECKED_OUT_TO)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_shakos_checked ON SHAKOS(CHECKED_OUT_TO)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_instruments_checked ON INSTRUMENTS(CHECKED_OUT_TO)")
+    # Expression indexes matching the "available first" sort so those
+    # queries read in index order instead of sorting every reload.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_uniforms_avail ON UNIFORMS((CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_shakos_avail ON SHAKOS((CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID)")
+
+    # Seed instrument types
+    conn.executemany(
+        "INSERT OR IGNORE INTO INSTRUMENT_TYPES (TYPE_NAME, SECTION) VALUES (?, ?)",
+        INSTRUMENT_CATALOG
+    )
+
+    conn.commit()
+
+class TupleTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a plain list of row tuples.
+
+    Cells are formatted on demand in data(), so reloading the table is a
+    single model reset instead of one QTableWidgetItem per cell.
+    """
+    FETCH_PAGE = 200
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+        self._visible = 0
+
+    def set_rows(self, rows):
+        """Show the first page now; the rest is exposed as the view scrolls."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._visible = min(len(self._rows), self.FETCH_PAGE)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._visible < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        more = min(self.FETCH_PAGE, len(self._rows) - self._visible)
+        if more <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible, self._visible + more - 1)
+        self._visible += more
+        self.endInsertRows()
+
+    def row(self, i):
+        return self._rows[i]
+
+    def total_rows(self):
+        """Full row count, including pages the view has not fetched yet."""
+        return len(self._rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._visible
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def cell(self, row, col):
+        return row[col]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = self.cell(self._rows[index.row()], index.column())
+        return "" if value is None else str(value)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+class QueryWorker(QRunnable):
+    """
+    Runs one SELECT on a pooled thread against its own read-only connection
+    and hands the rows back to the GUI thread via a signal. The token lets
+    the receiver drop results that a newer query has superseded.
+    """
+    class Signals(QObject):
+        finished = Signal(object, list, str)  # token, rows, error ('' on success)
+
+    def __init__(self, sql, params, token):
+        super().__init__()
+        self.sql = sql
+        self.params = params
+        self.token = token
+        self.signals = self.Signals()
+
+    def run(self):
+        rows, error = [], ""
+        try:
+            conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+            try:
+                conn.execute("PRAGMA busy_timeout = 5000;")
+                rows = conn.execute(self.sql, self.params).fetchall()
+            finally:
+                conn.close()
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.token, rows, error)
+
+class CsvExportWorker(QRunnable):
+    """
+    Runs one of the module CSV writers on a pooled thread against its own
+    read-only connection so large exports never block the GUI.
+    """
+    class Signals(QObject):
+        finished = Signal(str, str)  # path, error message ('' on success)
+
+    def __init__(self, writer, path):
+        super().__init__()
+        self.writer = writer
+        self.path = path
+        self.signals = self.Signals()
+
+    def run(self):
+        error = ""
+        try:
+            conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+            try:
+                conn.execute("PRAGMA busy_timeout = 5000;")
+                self.writer(conn, self.path)
+            finally:
+                conn.close()
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(self.path, error)
+
+class SeedWorker(QRunnable):
+    """
+    Runs the first-launch sample seed on a pooled thread with its own
+    writable connection so the window can paint before the inserts land.
+    """
+    class Signals(QObject):
+        finished = Signal(str)  # error message ('' on success)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+
+    def run(self):
+        error = ""
+        try:
+            conn = connect_db()
+            try:
+                seed_sample_data(conn)
+            finally:
+                conn.close()
+        except Exception as e:
+            error = str(e)
+        self.signals.finished.emit(error)
+
+class ComplianceModel(TupleTableModel):
+    """Formats compliance rows (sid, name, credits, gpa, dues, last, active, eligible)."""
+    HEADERS = ["ID", "Name", "Credits", "GPA", "Dues", "Eligible", "Last Verified", "Active"]
+
+    def __init__(self, parent=None):
+        super().__init__(self.HEADERS, parent)
+
+    def cell(self, row, col):
+        sid, name, credits, gpa, dues, last, active, eligible = row
+        if col == 0:
+            return sid
+        if col == 1:
+            return name
+        if col == 2:
+            return credits
+        if col == 3:
+            return f"{gpa:.2f}"
+        if col == 4:
+            return "Yes" if dues == 1 else "No"
+        if col == 5:
+            return "YES" if eligible else "NO"
+        if col == 6:
+            return last
+        return "Yes" if active == 1 else "No"
+
+class StudentsModel(TupleTableModel):
+    """Formats roster rows; the trailing column is the SQL-computed eligibility flag."""
+    HEADERS = ["ID", "First", "Last", "Class", "Section", "Instrument", "Shirt", "Shoe", "Active", "Eligible"]
+
+    def __init__(self, parent=None):
+        super().__init__(self.HEADERS, parent)
+        self._sid_to_row = {}
+
+    def set_rows(self, rows):
+        super().set_rows(rows)
+        self._sid_to_row = {r[0]: i for i, r in enumerate(self._rows)}
+
+    def row_for_sid(self, sid):
+        return self._sid_to_row.get(sid)
+
+    def cell(self, row, col):
+        if col == 8:
+            return "Yes" if row[8] == 1 else "No"
+        if col == 9:
+            return "YES" if row[9] else "NO"
+        return row[col]
+
+_SHADOW_CSS_CACHE = {}
+
+def shadow_border_image_css(blur=22):
+    """
+    Render the card shadow once as a 9-slice PNG and return a border-image
+    rule for it. A live QGraphicsDropShadowEffect re-blurs an offscreen copy
+    of the widget on every repaint; a sliced image is a constant-size blit
+    however the widget resizes.
+    """
+    cached = _SHADOW_CSS_CACHE.get(blur)
+    if cached is not None:
+        return cached[0]
+
+    size = 3 * blur
+    img = QImage(size, size, QImage.Format_ARGB32)
+    img.fill(Qt.transparent)
+
+    # Analytic Gaussian shadow: the blur of an axis-aligned box separates
+    # into per-axis erf integrals, so each pixel gets its exact coverage in
+    # one evaluation instead of a sampled blur kernel.
+    sigma = blur / 2.0
+    inv = 1.0 / (sigma * math.sqrt(2.0))
+    lo, hi = blur, size - blur
+
+    def coverage(v):
+        return 0.5 * (math.erf((v - lo + 0.5) * inv) - math.erf((v - hi + 0.5) * inv))
+
+    cov = [coverage(v) for v in range(size)]
+    for py in range(size):
+        for px in range(size):
+            a = int(90 * cov[py] * cov[px])
+            if a > 0:
+                img.setPixelColor(px, py, QColor(0, 0, 0, a))
+
+    p = QPainter(img)
+    p.setRenderHint(QPainter.Antialiasing)
+    p.setPen(Qt.NoPen)
+    p.setBrush(QColor("white"))
+    p.setPen(QPen(QColor("#d1d8e0"), 2))
+    p.drawRoundedRect(blur, blur, size - 2 * blur, size - 2 * blur, 10, 10)
+    p.end()
+
+    # QSS url() only resolves filesystem and ":/" resource paths, not data:
+    # URIs, so the slice goes to a temp file. The QTemporaryFile is cached
+    # alongside the rule to keep the file on disk until the process exits.
+    tmp = QTemporaryFile(QDir.tempPath() + "/bandapp-shadow-XXXXXX.png")
+    tmp.open()
+    img.save(tmp, "PNG")
+    tmp.close()
+    css = (f"border: {blur}px solid transparent; "
+           f"border-image: url({tmp.fileName()}) {blur} stretch;")
+    _SHADOW_CSS_CACHE[blur] = (css, tmp)
+    return css
+
+def apply_ops(conn, ops):
+    """
+    Execute a list of (sql, params) inside the current transaction, batching
+    consecutive ops that share the same SQL through executemany.
+    """
+    i = 0
+    n = len(ops)
+    while i < n:
+        sql = ops[i][0]
+        j = i + 1
+        while j < n and ops[j][0] == sql:
+            j += 1
+        if j - i > 1:
+            conn.executemany(sql, [params for _, params in ops[i:j]])
+        else:
+            conn.execute(sql, ops[i][1])
+        i = j
+
+# SQL for the per-row helper lookups lives at module level so every call
+# passes the same string object and hits sqlite3's prepared-statement cache.
+SQL_STUDENT_EXISTS = "SELECT 1 FROM STUDENTS WHERE STUDENT_ID=?"
+SQL_STUDENT_NAME = "SELECT FNAME, LNAME FROM STUDENTS WHERE STUDENT_ID=?"
+
+def check_student_exists(conn, student_id):
+    cur = conn.execute(SQL_STUDENT_EXISTS, (student_id,))
+    return cur.fetchone() is not None
+
+def get_student_name(conn, student_id):
+    cur = conn.execute(SQL_STUDENT_NAME, (student_id,))
+    r = cur.fetchone()
+    return f"{r[0]} {r[1]}" if r else ""
+
+# One round trip for everything the instrument-assign path checks up front:
+# whether the student exists, their section and the instrument's section.
+SQL_ASSIGN_CONTEXT = """
+    SELECT s.STUDENT_ID, COALESCE(s.SECTION,''), COALESCE(t.SECTION,'')
+    FROM INSTRUMENTS i
+    JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
+    LEFT JOIN STUDENTS s ON s.STUDENT_ID=?
+    WHERE i.INSTRUMENT_ID=?
+"""
+
+def fetch_assign_context(conn, sid, instrument_id):
+    cur = conn.execute(SQL_ASSIGN_CONTEXT, (sid, instrument_id))
+    return cur.fetchone()
+
+# Both variants are frozen at import time so conn.execute always receives
+# the identical string object and reuses the cached prepared statement.
+_ROSTER_SELECT = """
+    SELECT s.STUDENT_ID, s.FNAME, s.LNAME,
+           COALESCE(s.CLASSIFICATION,''), COALESCE(s.SECTION,''),
+           COALESCE(s.PRIMARY_ROLE,''), COALESCE(s.SHIRT_SIZE,''), COALESCE(s.SHOE_SIZE,''),
+           COALESCE(s.ACTIVE,1),
+           (COALESCE(c.CREDIT_HOURS, 0) >= 12 AND COALESCE(c.GPA, 0.0) >= 3.0
+            AND COALESCE(c.DUES_PAID, 0) = 1) AS ELIGIBLE
+    FROM STUDENTS s
+    LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
+    {where}
+    ORDER BY s.SECTION, s.LNAME, s.FNAME
+"""
+SQL_ROSTER_ALL = _ROSTER_SELECT.format(where="")
+SQL_ROSTER_ACTIVE = _ROSTER_SELECT.format(where="WHERE COALESCE(s.ACTIVE, 1) = 1")
+
+# delete_student pre-images via RETURNING: each statement applies its write
+# and hands back the columns the undo op needs, so no snapshot SELECTs run.
+SQL_DELETE_STUDENT = """
+    DELETE FROM STUDENTS WHERE STUDENT_ID=?
+    RETURNING STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''),
+              COALESCE(PRIMARY_ROLE,''), COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''),
+              COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
+"""
+
+SQL_DELETE_COMPLIANCE = """
+    DELETE FROM COMPLIANCE WHERE STUDENT_ID=?
+    RETURNING STUDENT_ID, COALESCE(CREDIT_HOURS,0), COALESCE(GPA,0.0),
+              COALESCE(DUES_PAID,0), COALESCE(LAST_VERIFIED_DATE,'')
+"""
+
+# UPDATE ... RETURNING yields post-update values, but only CHECKED_OUT_TO
+# changes here, so the returned date and notes are still the pre-image.
+SQL_RELEASE_INSTRUMENT = """
+    UPDATE INSTRUMENTS SET CHECKED_OUT_TO=NULL WHERE CHECKED_OUT_TO=?
+    RETURNING INSTRUMENT_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'')
+"""
+
+SQL_RELEASE_UNIFORM = """
+    UPDATE UNIFORMS SET CHECKED_OUT_TO=NULL WHERE CHECKED_OUT_TO=?
+    RETURNING UNIFORM_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'')
+"""
+
+SQL_RELEASE_SHAKO = """
+    UPDATE SHAKOS SET CHECKED_OUT_TO=NULL WHERE CHECKED_OUT_TO=?
+    RETURNING SHAKO_ID, COALESCE(CHECKED_OUT_DATE,''), COALESCE(CONDITION_NOTES,'')
+"""
+
+# The three equipment tables share one assign/unassign shape; building the
+# SQL per (table, pk) pair at import keeps each string a stable statement-
+# cache key no matter which tab the click came from.
+_EQUIP_TABLES = {
+    "uniform": ("UNIFORMS", "UNIFORM_ID"),
+    "shako": ("SHAKOS", "SHAKO_ID"),
+    "instrument": ("INSTRUMENTS", "INSTRUMENT_ID"),
+}
+_EQUIP_HOLD_SQL = {
+    k: f"SELECT CHECKED_OUT_TO, CHECKED_OUT_DATE, COALESCE(CONDITION_NOTES,'') FROM {t} WHERE {pk}=?"
+    for k, (t, pk) in _EQUIP_TABLES.items()
+}
+# The guard and the pre-image ride one statement: the UPDATE only lands on a
+# free row, and RETURNING reads CONDITION_NOTES, which it does not modify, so
+# the value that comes back is the pre-assignment one.  (RETURNING sees
+# post-update values in SQLite, so columns being SET cannot be captured; the
+# unassign path keeps a snapshot SELECT under BEGIN IMMEDIATE instead.)
+_EQUIP_ASSIGN_SQL = {
+    k: f"UPDATE {t} SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=? WHERE {pk}=? AND CHECKED_OUT_TO IS NULL RETURNING COALESCE(CONDITION_NOTES,'')"
+    for k, (t, pk) in _EQUIP_TABLES.items()
+}
+_EQUIP_NOTES_SQL = {
+    k: f"UPDATE {t} SET CONDITION_NOTES=? WHERE {pk}=?"
+    for k, (t, pk) in _EQUIP_TABLES.items()
+}
+_EQUIP_UNASSIGN_SQL = {
+    k: f"UPDATE {t} SET CHECKED_OUT_TO=NULL, CHECKED_OUT_DATE=NULL, CONDITION_NOTES=? WHERE {pk}=?"
+    for k, (t, pk) in _EQUIP_TABLES.items()
+}
+_EQUIP_RESTORE_SQL = {
+    k: f"UPDATE {t} SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE {pk}=?"
+    for k, (t, pk) in _EQUIP_TABLES.items()
+}
+
+_COMPLIANCE_SELECT = """
+    SELECT s.STUDENT_ID,
+           s.FNAME || ' ' || s.LNAME,
+           COALESCE(c.CREDIT_HOURS, 0),
+           COALESCE(c.GPA, 0.0),
+           COALESCE(c.DUES_PAID, 0),
+           COALESCE(c.LAST_VERIFIED_DATE, ''),
+           COALESCE(s.ACTIVE, 1),
+           (COALESCE(c.CREDIT_HOURS, 0) >= 12 AND COALESCE(c.GPA, 0.0) >= 3.0
+            AND COALESCE(c.DUES_PAID, 0) = 1) AS ELIGIBLE
+    FROM STUDENTS s
+    LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
+    {where}
+    ORDER BY s.LNAME, s.FNAME
+"""
+_COMPLIANCE_SQL_ALL = _COMPLIANCE_SELECT.format(where="")
+_COMPLIANCE_SQL_FILTERED = _COMPLIANCE_SELECT.format(
+    where="WHERE s.STUDENT_ID LIKE ? OR (s.FNAME || ' ' || s.LNAME) LIKE ?")
+_COMPLIANCE_SQL_FTS = """
+    SELECT s.STUDENT_ID,
+           s.FNAME || ' ' || s.LNAME,
+           COALESCE(c.CREDIT_HOURS, 0),
+           COALESCE(c.GPA, 0.0),
+           COALESCE(c.DUES_PAID, 0),
+           COALESCE(c.LAST_VERIFIED_DATE, ''),
+           COALESCE(s.ACTIVE, 1),
+           (COALESCE(c.CREDIT_HOURS, 0) >= 12 AND COALESCE(c.GPA, 0.0) >= 3.0
+            AND COALESCE(c.DUES_PAID, 0) = 1) AS ELIGIBLE
+    FROM STUDENTS_FTS
+    JOIN STUDENTS s ON s.STUDENT_ID = STUDENTS_FTS.rowid
+    LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
+    WHERE STUDENTS_FTS MATCH ?
+    ORDER BY s.LNAME, s.FNAME
+"""
+
+def write_students_csv(conn, path):
+    """Stream the student roster to path; shared by the File menu export."""
+    cur = conn.execute("""
+        SELECT STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''),
+               COALESCE(PRIMARY_ROLE,''), COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
+        FROM STUDENTS
+        ORDER BY SECTION, LNAME, FNAME
+    """)
+    cur.arraysize = 1000
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["Student ID", "First", "Last", "Class", "Section", "Instrument", "Shirt", "Shoe", "Active", "Updated"])
+        w.writerows(
+            (r[0], r[1], r[2], r[3], r[4], r[5], r[6], r[7], "Yes" if r[8] == 1 else "No", r[9])
+            for r in cur)
+
+def write_compliance_csv(conn, path):
+    """Stream the compliance report to path; shared by the dialog and the File menu."""
+    cur = conn.execute("""
+        SELECT s.STUDENT_ID, s.FNAME, s.LNAME, COALESCE(s.CLASSIFICATION, ''), COALESCE(s.SECTION, ''),
+               COALESCE(c.CREDIT_HOURS, 0), COALESCE(c.GPA, 0.0), COALESCE(c.DUES_PAID, 0), COALESCE(c.LAST_VERIFIED_DATE, ''),
+               (COALESCE(c.CREDIT_HOURS, 0) >= 12 AND COALESCE(c.GPA, 0.0) >= 3.0
+                AND COALESCE(c.DUES_PAID, 0) = 1) AS ELIGIBLE
+        FROM STUDENTS s
+        LEFT JOIN COMPLIANCE c ON s.STUDENT_ID = c.STUDENT_ID
+        ORDER BY s.SECTION, s.LNAME, s.FNAME
+    """)
+    cur.arraysize = 1000
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["Student ID", "First", "Last", "Class", "Section", "Credits", "GPA", "Dues Paid", "Eligible", "Last Verified"])
+        # writerows iterates in C; the generator keeps the export
+        # streaming instead of holding the roster in memory.
+        w.writerows(
+            (r[0], r[1], r[2], r[3], r[4], r[5], f"{r[6]:.2f}",
+             "Yes" if r[7] == 1 else "No", "Yes" if r[9] else "No", r[8])
+            for r in cur
+        )
+
+def write_inventory_csv(conn, path):
+    """Stream all three inventory sections to path; shared by the dialog and the File menu."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["INSTRUMENTS"])
+        w.writerow(["ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"])
+        cur = conn.execute("""
+            SELECT i.INSTRUMENT_ID, t.TYPE_NAME, t.SECTION, IFNULL(i.SERIAL,''), IFNULL(i.CONDITION_NOTES,''),
+                   IFNULL(i.CHECKED_OUT_TO,''), IFNULL(i.CHECKED_OUT_DATE,''),
+                   CASE WHEN i.CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
+            FROM INSTRUMENTS i
+            JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
+            ORDER BY t.SECTION, t.TYPE_NAME, i.INSTRUMENT_ID
+        """)
+        cur.arraysize = 1000
+        w.writerows(cur)
+
+        w.writerow([])
+        w.writerow(["UNIFORMS"])
+        w.writerow(["ID", "Coat", "Pant", "Coat #", "Pant #", "Condition", "Assigned To", "Date", "Available"])
+        cur = conn.execute("""
+            SELECT UNIFORM_ID, IFNULL(COAT_SIZE,''), IFNULL(PANT_SIZE,''), IFNULL(COAT_NUMBER,''), IFNULL(PANT_NUMBER,''),
+                   IFNULL(CONDITION_NOTES,''), IFNULL(CHECKED_OUT_TO,''), IFNULL(CHECKED_OUT_DATE,''),
+                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
+            FROM UNIFORMS
+            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID
+        """)
+        cur.arraysize = 1000
+        w.writerows(cur)
+
+        w.writerow([])
+        w.writerow(["SHAKOS"])
+        w.writerow(["ID", "Size", "Condition", "Assigned To", "Date", "Available"])
+        cur = conn.execute("""
+            SELECT SHAKO_ID, IFNULL(SIZE,''), IFNULL(CONDITION_NOTES,''), IFNULL(CHECKED_OUT_TO,''), IFNULL(CHECKED_OUT_DATE,''),
+                   CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
+            FROM SHAKOS
+            ORDER BY (CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID
+        """)
+        cur.arraysize = 1000
+        w.writerows(cur)
+
+class ComplianceDialog(QDialog):
+    def __init__(self, parent, conn):
+        super().__init__(parent)
+        self.setWindowTitle("Compliance Manager")
+        self.conn = conn
+        self.undo_push = parent.push_undo_ops
+        self.refresh_all = parent.refresh_all
+        self.show_error = parent.show_error
+        self.show_message = parent.show_message
+        self.apply_shadow = parent.apply_shadow
+        self.resize(950, 620)
+        self._columns_sized = False
+        self._load_generation = 0
+        self.setup_ui()
+        self.load()
+
+    def setup_ui(self):
+        root = QVBoxLayout(self)
+
+        top = QHBoxLayout()
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.load)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search by ID or name…")
+        self.search.textChanged.connect(lambda _: self._search_timer.start())
+        top.addWidget(self.search)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load)
+        top.addWidget(refresh_btn)
+
+        export_btn = QPushButton("Export CSV")
+        export_btn.clicked.connect(self.export_csv)
+        top.addWidget(export_btn)
+
+        root.addLayout(top)
+
+        self.model = ComplianceModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.selectionModel().selectionChanged.connect(self.on_select)
+        self.table.setShowGrid(True)
+        root.addWidget(self.table)
+
+        bottom = QHBoxLayout()
+
+        edit_group = QGroupBox("Edit Selected")
+        form = QFormLayout(edit_group)
+
+        self.sel = QLabel("No student selected")
+        self.sel.setObjectName("highlight")
+        form.addRow("Selected:", self.sel)
+
+        self.credits = QSpinBox()
+        self.credits.setRange(0, 30)
+        form.addRow("Credit Hours:", self.credits)
+
+        self.gpa = QDoubleSpinBox()
+        self.gpa.setRange(0.0, 4.0)
+        self.gpa.setDecimals(2)
+        form.addRow("GPA:", self.gpa)
+
+        self.dues = QComboBox()
+        self.dues.addItems(["No", "Yes"])
+        form.addRow("Dues Paid:", self.dues)
+
+        self.save_btn = QPushButton("Save")
+        self.save_btn.setEnabled(False)
+        self.save_btn.clicked.connect(self.save)
+        form.addRow(self.save_btn)
+
+        bottom.addWidget(edit_group)
+        root.addLayout(bottom)
+
+        self.apply_shadow(edit_group)
+
+    def load(self):
+        q = self.search.text().strip()
+        if q:
+            # Name searches go through the FTS5 index; ID fragments, single
+            # characters, and punctuation-only input (which tokenizes to an
+            # empty MATCH string) keep the LIKE scan.
+            match = fts_match_query(q)
+            if FTS_ENABLED and len(q) > 1 and not q.isdigit() and match:
+                sql, params = _COMPLIANCE_SQL_FTS, (match,)
+            else:
+                like = f"%{q}%"
+                sql, params = _COMPLIANCE_SQL_FILTERED, (like, like)
+        else:
+            sql, params = _COMPLIANCE_SQL_ALL, ()
+
+        # Query on a pooled thread so a slow search never freezes the UI.
+        self._load_generation += 1
+        worker = QueryWorker(sql, params, self._load_generation)
+        worker.signals.finished.connect(self._on_rows_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_rows_loaded(self, generation, rows, error):
+        if generation != self._load_generation:
+            return  # a newer search superseded this result
+        if error:
+            self.show_error(f"Error: {error}")
+            return
+        self.model.set_rows(rows)
+        if not self._columns_sized:
+            # Measuring every cell is O(rows x cols); do it once, then keep
+            # the widths across reloads.
+            self.table.resizeColumnsToContents()
+            self._columns_sized = True
+
+    def on_select(self):
+        row = self.table.currentIndex().row()
+        if row < 0:
+            self.sel.setText("No student selected")
+            self.save_btn.setEnabled(False)
+            return
+
+        # Work from the raw row tuple; no round trip through display strings.
+        sid, name, credits, gpa, dues, _last, _active, _eligible = self.model.row(row)
+
+        self.sel.setText(f"{sid} - {name}")
+        self.save_btn.setEnabled(True)
+
+        self.credits.setValue(credits)
+        self.gpa.setValue(gpa)
+        self.dues.setCurrentIndex(1 if dues == 1 else 0)
+
+    def save(self):
+        row = self.table.currentIndex().row()
+        if row < 0:
+            return
+        sid = self.model.row(row)[0]
+
+        cur = self.conn.execute("""
+            SELECT COALESCE(CREDIT_HOURS, 0), COALESCE(GPA, 0.0), COALESCE(DUES_PAID, 0), COALESCE(LAST_VERIFIED_DATE, '')
+            FROM COMPLIANCE WHERE STUDENT_ID=?
+        """, (sid,))
+        old = cur.fetchone() or (0, 0.0, 0, "")
+
+        new_credits = self.credits.value()
+        new_gpa = self.gpa.value()
+        new_dues = 1 if self.dues.currentIndex() == 1 else 0
+        new_date = date.today().isoformat()
+
+        ops = [
+            ("INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
+             "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
+             (sid, new_credits, new_gpa, new_dues, new_date))
+        ]
+
+        undo_ops = [
+            ("INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
+             "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
+             (sid, old[0], old[1], old[2], old[3]))
+        ]
+
+        try:
+            # IMMEDIATE grabs the write lock up front so the transaction
+            # can't fail a deferred-to-write upgrade under WAL.
+            self.conn.execute("BEGIN IMMEDIATE")
+            apply_ops(self.conn, ops)
+            self.conn.commit()
+            self.undo_push("Edit Compliance", undo_ops)
+            self.load()
+            self.refresh_all()
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def export_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Compliance Report", "compliance_report.csv", "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            write_compliance_csv(self.conn, path)
+            self.show_message("Saved", f"Saved to:\n{path}")
+        except Exception as e:
+            self.show_error(f"Error: {str(e)}")
+
+_INSTR_Q_FILTER = ("(t.TYPE_NAME LIKE ? OR IFNULL(i.SERIAL,'') LIKE ? "
+                   "OR IFNULL(i.CONDITION_NOTES,'') LIKE ? OR IFNULL(i.CHECKED_OUT_TO,'') LIKE ?)")
+
+def _instr_sql(where):
+    return f"""
+        SELECT i.INSTRUMENT_ID, t.TYPE_NAME, t.SECTION,
+               IFNULL(i.SERIAL,''), IFNULL(i.CONDITION_NOTES,''),
+               IFNULL(i.CHECKED_OUT_TO,''), IFNULL(i.CHECKED_OUT_DATE,''),
+               CASE WHEN i.CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END
+        FROM INSTRUMENTS i
+        JOIN INSTRUMENT_TYPES t ON i.TYPE_ID=t.TYPE_ID
+        {where}
+        ORDER BY t.SECTION, t.TYPE_NAME, i.INSTRUMENT_ID
+    """
+
+# Keyed by (section filtered, search text present); built once at import.
+_INSTR_SQL = {
+    (False, False): _instr_sql(""),
+    (True, False): _instr_sql("WHERE t.SECTION=?"),
+    (False, True): _instr_sql(f"WHERE {_INSTR_Q_FILTER}"),
+    (True, True): _instr_sql(f"WHERE t.SECTION=? AND {_INSTR_Q_FILTER}"),
+}
+
+def _uniform_sql(where):
+    return f"""
+        SELECT UNIFORM_ID, IFNULL(COAT_SIZE,''), IFNULL(PANT_SIZE,''),
+               IFNULL(COAT_NUMBER,''), IFNULL(PANT_NUMBER,''),
+               IFNULL(CONDITION_NOTES,''),
+               IFNULL(CHECKED_OUT_TO,''), IFNULL(CHECKED_OUT_DATE,''),
+               CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END,
+               (IFNULL(COAT_SIZE,'') || '/' || IFNULL(PANT_SIZE,''))
+        FROM UNIFORMS
+        {where}
+        ORDER BY (CHECKED_OUT_TO IS NULL) DESC, UNIFORM_ID
+    """
+
+_UNIFORM_SQL_ALL = _uniform_sql("")
+_UNIFORM_SQL_FILTERED = _uniform_sql(
+    "WHERE IFNULL(COAT_SIZE,'') LIKE ? OR IFNULL(PANT_SIZE,'') LIKE ? "
+    "OR IFNULL(COAT_NUMBER,'') LIKE ? OR IFNULL(PANT_NUMBER,'') LIKE ? "
+    "OR IFNULL(CONDITION_NOTES,'') LIKE ? OR IFNULL(CHECKED_OUT_TO,'') LIKE ?")
+
+def _shako_sql(where):
+    return f"""
+        SELECT SHAKO_ID, IFNULL(SIZE,''), IFNULL(CONDITION_NOTES,''),
+               IFNULL(CHECKED_OUT_TO,''), IFNULL(CHECKED_OUT_DATE,''),
+               CASE WHEN CHECKED_OUT_TO IS NULL THEN 'Yes' ELSE 'No' END,
+               IFNULL(SIZE,'')
+        FROM SHAKOS
+        {where}
+        ORDER BY (CHECKED_OUT_TO IS NULL) DESC, SHAKO_ID
+    """
+
+_SHAKO_SQL_ALL = _shako_sql("")
+_SHAKO_SQL_FILTERED = _shako_sql(
+    "WHERE IFNULL(SIZE,'') LIKE ? OR IFNULL(CONDITION_NOTES,'') LIKE ? "
+    "OR IFNULL(CHECKED_OUT_TO,'') LIKE ?")
+
+class InventoryDialog(QDialog):
+    def __init__(self, parent, conn):
+        super().__init__(parent)
+        self.setWindowTitle("Inventory Viewer")
+        self.conn = conn
+        self.apply_shadow = parent.apply_shadow
+        self.show_error = parent.show_error
+        self.show_message = parent.show_message
+        self.refresh_all = parent.refresh_all
+        self.undo_push = parent.push_undo_ops
+        self.resize(1100, 680)
+        self._columns_sized = set()
+        self._load_generation = 0
+        self.setup_ui()
+        self.load_all()
+
+    def setup_ui(self):
+        root = QVBoxLayout(self)
+
+        top = QHBoxLayout()
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.load_all)
+
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search inventory… (type, serial, size, assigned ID)")
+        self.search.textChanged.connect(lambda _: self._search_timer.start())
+        top.addWidget(self.search)
+
+        self.section_filter = QComboBox()
+        self.section_filter.addItems(["All Sections"] + SECTIONS)
+        self.section_filter.currentIndexChanged.connect(lambda _: self._search_timer.start())
+        top.addWidget(self.section_filter)
+
+        export_btn = QPushButton("Export Inventory CSV")
+        export_btn.clicked.connect(self.export_csv)
+        top.addWidget(export_btn)
+
+        root.addLayout(top)
+
+        self.tabs = QTabWidget()
+        # Only the visible tab is queried; switching tabs loads on demand.
+        self.tabs.currentChanged.connect(lambda _: self.load_all())
+        root.addWidget(self.tabs)
+
+        self.instr_model = TupleTableModel(
+            ["ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"], self)
+        self.instr = QTableView()
+        self.instr.setModel(self.instr_model)
+        self._prep_table(self.instr)
+        self.tabs.addTab(self.instr, "Instruments")
+
+        self.uni_model = TupleTableModel(
+            ["ID", "Coat", "Pant", "Coat #", "Pant #", "Condition", "Assigned To", "Date", "Available", "Size Key"], self)
+        self.uni = QTableView()
+        self.uni.setModel(self.uni_model)
+        self._prep_table(self.uni)
+        self.tabs.addTab(self.uni, "Uniforms")
+
+        self.sha_model = TupleTableModel(
+            ["ID", "Size", "Condition", "Assigned To", "Date", "Available", "Size Key"], self)
+        self.sha = QTableView()
+        self.sha.setModel(self.sha_model)
+        self._prep_table(self.sha)
+        self.tabs.addTab(self.sha, "Shakos")
+
+        footer = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_all)
+        footer.addWidget(refresh_btn)
+
+        footer.addStretch()
+        root.addLayout(footer)
+
+    def _prep_table(self, t):
+        t.setSelectionBehavior(QAbstractItemView.SelectRows)
+        t.setAlternatingRowColors(True)
+        t.verticalHeader().setVisible(False)
+        t.horizontalHeader().setStretchLastSection(True)
+        t.setWordWrap(False)
+        t.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        t.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        t.setShowGrid(True)
+
+    def load_all(self):
+        q = self.search.text().strip()
+        sec = self.section_filter.currentText()
+
+        like = f"%{q}%"
+
+        # Only query the tab the user can actually see; the hidden tabs
+        # reload when they become current.
+        idx = self.tabs.currentIndex()
+        if idx == 0:
+            params = []
+            if sec != "All Sections":
+                params.append(sec)
+            if q:
+                params.extend([like] * 4)
+            key, sql = "instr", _INSTR_SQL[(sec != "All Sections", bool(q))]
+        elif idx == 1:
+            key, sql = "uni", _UNIFORM_SQL_FILTERED if q else _UNIFORM_SQL_ALL
+            params = [like] * 6 if q else ()
+        else:
+            key, sql = "sha", _SHAKO_SQL_FILTERED if q else _SHAKO_SQL_ALL
+            params = [like] * 3 if q else ()
+
+        self._load_generation += 1
+        worker = QueryWorker(sql, params, (key, self._load_generation))
+        worker.signals.finished.connect(self._on_rows_loaded)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_rows_loaded(self, token, rows, error):
+        key, generation = token
+        if generation != self._load_generation:
+            return
+        if error:
+            self.show_error(f"Error: {error}")
+            return
+        model, view = {
+            "instr": (self.instr_model, self.instr),
+            "uni": (self.uni_model, self.uni),
+            "sha": (self.sha_model, self.sha),
+        }[key]
+        model.set_rows(rows)
+
+        if key not in self._columns_sized:
+            view.resizeColumnsToContents()
+            self._columns_sized.add(key)
+
+    def export_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Inventory", "inventory.csv", "CSV Files (*.csv)")
+        if not path:
+            return
+        try:
+            write_inventory_csv(self.conn, path)
+            self.show_message("Saved", f"Saved to:\n{path}")
+        except Exception as e:
+            self.show_error(f"Error: {str(e)}")
+
+class BandDatabaseApp(QMainWindow):
+    EDIT_TAB_INDEX = 1
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Marching Band Database")
+
+        self.conn = connect_db()
+        create_tables(self.conn)
+
+        # First-launch seeding happens off-thread; the queued finished
+        # signal reloads the views once the sample rows are committed.
+        worker = SeedWorker()
+        worker.signals.finished.connect(self._on_seed_done)
+        QThreadPool.globalInstance().start(worker)
+
+        school_year_col = next(
+            (r for r in table_info(self.conn, "STUDENTS") if r[1] == "SCHOOL_YEAR"), None)
+        self.students_requires_school_year = school_year_col is not None and bool(school_year_col[3])
+
+        # Bounded so a long session cannot accumulate snapshots without limit.
+        self.undo_stack = deque(maxlen=200)
+        self._refresh_pending = False
+        self._refresh_today()
+        self._pending_edit_sid = None
+        self._loaded_edit_sid = None
+        self._student_name_cache = {}
+        self._student_ids = set()
+
+        self.current_zoom = 100
+        self.current_font_size = 12
+        self.high_contrast_mode = False
+        # Static sheets keyed by the contrast mode alone; font size lives in
+        # the tiny dynamic overlay, so each mode's sheet is built once and
+        # Qt reuses the identical string on every revisit.
+        self._qss_cache = {}
+        self._static_qss_mode = None
+
+        self.setup_ui()
+
+        # Let SQLite refresh stale planner statistics in the background of a
+        # long-running session; optimize is a no-op when nothing has drifted.
+        self._optimize_timer = QTimer(self)
+        self._optimize_timer.setInterval(3600 * 1000)
+        self._optimize_timer.timeout.connect(self.run_pragma_optimize)
+        self._optimize_timer.start()
+
+    def run_pragma_optimize(self):
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+
+    def closeEvent(self, event):
+        self.run_pragma_optimize()
+        self.conn.close()
+        super().closeEvent(event)
+
+    def setup_ui(self):
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        self.root_layout = QVBoxLayout(main_widget)
+
+        self.setup_menu_bar()
+
+        self.tabs = QTabWidget()
+        self.root_layout.addWidget(self.tabs)
+
+        self.create_students_tab()
+        self.create_uniforms_tab()
+        self.create_shakos_tab()
+        self.create_instruments_tab()
+
+        self.status_bar = QLabel("Ready | Zoom: 100% | Normal Mode")
+        self.status_bar.setStyleSheet("""
+            QLabel {
+                background-color: #2c3e50;
+                color: white;
+                padding: 8px;
+                border-top: 2px solid #cd7b00;
+                font-weight: bold;
+            }
+        """)
+        self.root_layout.addWidget(self.status_bar)
+
+        self.setup_colors()
+
+        # One completer over one string-list model, attached once; refreshes
+        # only swap the string list when the roster actually changes.
+        self._ids_model = QStringListModel(self)
+        self._id_completer = QCompleter(self._ids_model, self)
+        self._id_completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self._id_completer.setFilterMode(Qt.MatchContains)
+        for le in [self.add_id, self.edit_id_readonly, self.assign_instr_student,
+                   self.assign_uni_student, self.assign_shako_student]:
+            le.setCompleter(self._id_completer)
+
+        # kind -> (row selector, student-id field, preview label, reloads)
+        self._equipment = {
+            "uniform": (self.get_selected_uniform_id, self.assign_uni_student,
+                        self.uni_preview, (self.load_uniforms,)),
+            "shako": (self.get_selected_shako_id, self.assign_shako_student,
+                      self.shako_preview, (self.load_shakos,)),
+            "instrument": (self.get_selected_instrument_id, self.assign_instr_student,
+                           self.instr_preview, (self.load_instruments, self.load_students)),
+        }
+
+        self.refresh_all()
+        self.rebuild_completers()
+
+    def setup_menu_bar(self):
+        menubar = self.menuBar()
+
+        file_menu = menubar.addMenu("&File")
+
+        inv_action = file_menu.addAction("Inventory Viewer")
+        inv_action.setShortcut("Ctrl+I")
+        inv_action.triggered.connect(self.open_inventory_viewer)
+
+        comp_action = file_menu.addAction("Compliance Manager")
+        comp_action.setShortcut("Ctrl+M")
+        comp_action.triggered.connect(self.open_compliance_manager)
+
+        file_menu.addSeparator()
+
+        export_students = file_menu.addAction("Export Students CSV")
+        export_students.triggered.connect(self.export_students_csv)
+
+        export_inventory = file_menu.addAction("Export Inventory CSV")
+        export_inventory.triggered.connect(self.export_inventory_csv)
+
+        export_compliance = file_menu.addAction("Export Compliance CSV")
+        export_compliance.triggered.connect(self.export_compliance_csv)
+
+        file_menu.addSeparator()
+
+        reset_db = file_menu.addAction("Reset Database (Wipe)")
+        reset_db.setShortcut("Ctrl+Shift+R")
+        reset_db.triggered.connect(self.reset_database)
+
+        file_menu.addSeparator()
+
+        exit_action = file_menu.addAction("Exit")
+        exit_action.setShortcut("Alt+F4")
+        exit_action.triggered.connect(self.close)
+
+        edit_menu = menubar.addMenu("&Edit")
+        undo_action = edit_menu.addAction("&Undo")
+        undo_action.setShortcut("Ctrl+Z")
+        undo_action.triggered.connect(self.undo_last)
+
+        view_menu = menubar.addMenu("&View")
+        self.students_columns_menu = view_menu.addMenu("Students Columns")
+        self.students_col_actions = {}
+
+        accessibility_menu = menubar.addMenu("&Accessibility")
+
+        zoom_menu = accessibility_menu.addMenu("&Zoom")
+        zoom_in_action = zoom_menu.addAction("Zoom In (+10%)")
+        zoom_in_action.triggered.connect(self.zoom_in)
+        zoom_in_action.setShortcut("Ctrl+=")
+
+        zoom_out_action = zoom_menu.addAction("Zoom Out (-10%)")
+        zoom_out_action.triggered.connect(self.zoom_out)
+        zoom_out_action.setShortcut("Ctrl+-")
+
+        reset_zoom_action = zoom_menu.addAction("Reset Zoom (100%)")
+        reset_zoom_action.triggered.connect(self.reset_zoom)
+        reset_zoom_action.setShortcut("Ctrl+0")
+
+        accessibility_menu.addSeparator()
+
+        fullscreen_action = accessibility_menu.addAction("Fullscreen")
+        fullscreen_action.setCheckable(True)
+        fullscreen_action.setShortcut("F11")
+        fullscreen_action.triggered.connect(self.toggle_fullscreen)
+
+        accessibility_menu.addSeparator()
+
+        contrast_menu = accessibility_menu.addMenu("Contrast")
+        normal_action = contrast_menu.addAction("Normal Contrast")
+        normal_action.triggered.connect(lambda: self.enable_high_contrast_mode(False))
+        high_action = contrast_menu.addAction("High Contrast Mode")
+        high_action.triggered.connect(lambda: self.enable_high_contrast_mode(True))
+
+        accessibility_menu.addSeparator()
+
+        keyboard_action = accessibility_menu.addAction("Keyboard Navigation Help")
+        keyboard_action.triggered.connect(self.show_keyboard_help)
+        keyboard_action.setShortcut("F1")
+
+    def setup_colors(self):
+        # Colors, borders and radii only change with the contrast mode, so the
+        # big sheet is installed app-wide at most once per mode switch. Zoom
+        # re-applies only the few font-size rules, sparing Qt a full style
+        # re-resolve over every widget.
+        if self.high_contrast_mode != self._static_qss_mode:
+            if self.high_contrast_mode:
+                QApplication.instance().setStyleSheet(self.get_high_contrast_stylesheet())
+            else:
+                QApplication.instance().setStyleSheet(self.get_normal_stylesheet())
+            self._static_qss_mode = self.high_contrast_mode
+        self.setStyleSheet(self._dynamic_qss())
+
+    def _dynamic_qss(self):
+        size = max(self.current_font_size, 13) if self.high_contrast_mode else self.current_font_size
+        return f"QWidget {{ font-size: {size}px; }} QLabel#highlight {{ font-size: {size + 1}px; }}"
+
+    def set_button_icon_safe(self, btn, preferred_sp, fallback_text):
+        try:
+            btn.setIcon(self.style().standardIcon(preferred_sp))
+        except Exception:
+            btn.setText(fallback_text)
+
+    def get_normal_stylesheet(self):
+        sheet = self._qss_cache.get(False)
+        if sheet is None:
+            sheet = self._qss_cache[False] = self._build_normal_stylesheet()
+        return sheet
+
+    def _build_normal_stylesheet(self):
+        return f"""
+            QMainWindow {{
+                background-color: #f5f7fa;
+            }}
+            QWidget {{
+                font-family: Segoe UI, Arial, sans-serif;
+            }}
+            QFrame#card {{
+                background-color: white;
+                border: 2px solid #d1d8e0;
+                border-radius: 12px;
+            }}
+            QGroupBox {{
+                border: 2px solid #d1d8e0;
+                border-radius: 10px;
+                margin-top: 22px;
+                padding: 12px;
+                padding-top: 18px;
+                font-weight: bold;
+                color: #2c3e50;
+                background-color: white;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                subcontrol-position: top left;
+                left: 12px;
+                top: 2px;
+                padding: 2px 8px;
+                color: #cd7b00;
+                background-color: white;
+            }}
+            QPushButton {{
+                background-color: #cd7b00;
+                color: white;
+                border: none;
+                padding: 8px 16px;
+                border-radius: 8px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: #b36b00;
+            }}
+            QPushButton:disabled {{
+                background-color: #bdc3c7;
+                color: #7f8c8d;
+            }}
+            QToolButton {{
+                background-color: #d1d8e0;
+                border: none;
+                border-radius: 8px;
+                padding: 6px;
+            }}
+            QToolButton:checked {{
+                background-color: #cd7b00;
+            }}
+            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
+                border: 1px solid #bdc3c7;
+                border-radius: 6px;
+                padding: 7px;
+                background-color: white;
+                color: #2c3e50;
+            }}
+            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
+                border: 2px solid #cd7b00;
+            }}
+
+            QComboBox QAbstractItemView {{
+                max-height: 160px;
+            }}
+
+            QTableWidget, QTableView {{
+                background-color: white;
+                border: 1px solid #d1d8e0;
+                gridline-color: rgba(44, 62, 80, 35);
+                selection-background-color: #cd7b00;
+                selection-color: white;
+                border-radius: 8px;
+            }}
+            QHeaderView::section {{
+                background-color: #006600;
+                color: white;
+                padding: 8px;
+                border: none;
+                font-weight: bold;
+            }}
+            QTabWidget::pane {{
+                border: 1px solid #d1d8e0;
+                background-color: white;
+                border-radius: 10px;
+            }}
+            QTabBar::tab {{
+                background-color: #d1d8e0;
+                color: #2c3e50;
+                padding: 8px 16px;
+                margin-right: 2px;
+                font-weight: bold;
+                border-top-left-radius: 10px;
+                border-top-right-radius: 10px;
+            }}
+            QTabBar::tab:selected {{
+                background-color: #cd7b00;
+                color: white;
+            }}
+            QLabel#highlight {{
+                font-weight: bold;
+                color: #e74c3c;
+            }}
+        """
+
+    def get_high_contrast_stylesheet(self):
+        sheet = self._qss_cache.get(True)
+        if sheet is None:
+            sheet = self._qss_cache[True] = self._build_high_contrast_stylesheet()
+        return sheet
+
+    def _build_high_contrast_stylesheet(self):
+        return f"""
+            QMainWindow {{
+                background-color: #000000;
+            }}
+            QWidget {{
+                font-family: Segoe UI, Arial, sans-serif;
+                color: #FFFFFF;
+            }}
+            QFrame#card {{
+                background-color: white;
+                border: 2px solid #d1d8e0;
+                border-radius: 12px;
+            }}
+            QGroupBox {{
+                border: 3px solid #FFFFFF;
+                border-radius: 10px;
+                margin-top: 12px;
+                padding-top: 12px;
+                font-weight: bold;
+                color: #FFFFFF;
+                background-color: #000000;
+            }}
+            QGroupBox::title {{
+                subcontrol-origin: margin;
+                left: 10px;
+                padding: 0 6px;
+                color: #FFFF00;
+                background-color: #000000;
+            }}
+            QPushButton {{
+                background-color: #000000;
+                color: #FFFFFF;
+                border: 2px solid #FFFFFF;
+                padding: 10px 18px;
+                border-radius: 8px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: #333333;
+                border: 3px solid #FFFF00;
+            }}
+            QToolButton {{
+                background-color: #333333;
+                border: 2px solid #FFFFFF;
+                border-radius: 8px;
+                padding: 6px;
+            }}
+            QToolButton:checked {{
+                background-color: #0000FF;
+                border-bottom: 3px solid #FFFF00;
+            }}
+            QLineEdit, QComboBox, QSpinBox, QDoubleSpinBox {{
+                border: 2px solid #FFFFFF;
+                border-radius: 6px;
+                padding: 8px;
+                background-color: #000000;
+                color: #FFFFFF;
+            }}
+            QLineEdit:focus, QComboBox:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
+                border: 3px solid #00FFFF;
+                background-color: #111111;
+            }}
+
+            QComboBox QAbstractItemView {{
+                max-height: 160px;
+            }}
+
+            QTableWidget, QTableView {{
+                background-color: #000000;
+                border: 2px solid #FFFFFF;
+                gridline-color: rgba(255,255,255,80);
+                selection-background-color: #0000FF;
+                selection-color: #FFFFFF;
+                alternate-background-color: #111111;
+                border-radius: 8px;
+            }}
+            QHeaderView::section {{
+                background-color: #000000;
+                color: #FFFFFF;
+                padding: 10px;
+                border: 1px solid #FFFFFF;
+                font-weight: bold;
+            }}
+            QTabWidget::pane {{
+                border: 2px solid #FFFFFF;
+                background-color: #000000;
+                border-radius: 10px;
+            }}
+            QTabBar::tab {{
+                background-color: #333333;
+                color: #FFFFFF;
+                padding: 10px 18px;
+                margin-right: 2px;
+                font-weight: bold;
+                border-top-left-radius: 10px;
+                border-top-right-radius: 10px;
+            }}
+            QTabBar::tab:selected {{
+                background-color: #0000FF;
+                color: #FFFFFF;
+                border-bottom: 3px solid #FFFF00;
+            }}
+            QLabel#highlight {{
+                font-weight: bold;
+                color: #FFFF00;
+                border: 1px solid #FFFF00;
+                padding: 2px;
+            }}
+        """
+
+    def apply_shadow(self, widget, blur=22):
+        widget.setStyleSheet(shadow_border_image_css(blur))
+
+    def push_undo_ops(self, label, undo_ops):
+        self.undo_stack.append((label, undo_ops))
+        self.update_status(f"{label} | Undo ready")
+
+    def undo_last(self):
+        if not self.undo_stack:
+            self.show_error("Nothing to undo")
+            return
+        label, ops = self.undo_stack.pop()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            apply_ops(self.conn, ops)
+            self.conn.commit()
+            self.refresh_all()
+            # Undoing an add or delete changes roster membership, so the ID
+            # completer and _student_ids must follow.
+            self.rebuild_completers()
+            self.update_status(f"Undid: {label}")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Undo failed: {str(e)}")
+
+    def update_status(self, message):
+        mode = "High Contrast" if self.high_contrast_mode else "Normal"
+        self.status_bar.setText(f"{message} | Zoom: {self.current_zoom}% | {mode} Mode")
+
+    def show_message(self, title, message):
+        QMessageBox.information(self, title, message)
+
+    def show_error(self, message):
+        QMessageBox.critical(self, "Error", message)
+
+    def ask_yes_no(self, title, question):
+        reply = QMessageBox.question(self, title, question, QMessageBox.Yes | QMessageBox.No)
+        return reply == QMessageBox.Yes
+
+    def validate_required(self, field: QLineEdit):
+        ok = bool(field.text().strip())
+        field.setStyleSheet("" if ok else "border: 2px solid #e74c3c;")
+        return ok
+
+    def rebuild_completers(self):
+        ids = [r[0] for r in self.conn.execute(
+            "SELECT STUDENT_ID FROM STUDENTS ORDER BY STUDENT_ID")]
+        self._student_ids = set(ids)
+        self._ids_model.setStringList([str(i) for i in ids])
+
+    def toggle_fullscreen(self, checked):
+        if checked:
+            self.showFullScreen()
+        else:
+            self.showNormal()
+
+    def open_compliance_manager(self):
+        dlg = ComplianceDialog(self, self.conn)
+        dlg.exec()
+
+    def open_inventory_viewer(self):
+        dlg = InventoryDialog(self, self.conn)
+        dlg.exec()
+
+    def _start_csv_export(self, writer, path):
+        worker = CsvExportWorker(writer, path)
+        worker.signals.finished.connect(self._on_export_done)
+        QThreadPool.globalInstance().start(worker)
+        self.update_status("Exporting…")
+
+    def _on_export_done(self, path, error):
+        if error:
+            self.show_error(f"Error: {error}")
+        else:
+            self.show_message("Saved", f"Saved to:\n{path}")
+            self.update_status("Export complete")
+
+    def export_students_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Students", "students.csv", "CSV Files (*.csv)")
+        if path:
+            self._start_csv_export(write_students_csv, path)
+
+    def export_inventory_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Inventory", "inventory.csv", "CSV Files (*.csv)")
+        if path:
+            self._start_csv_export(write_inventory_csv, path)
+
+    def export_compliance_csv(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Compliance Report", "compliance_report.csv", "CSV Files (*.csv)")
+        if path:
+            self._start_csv_export(write_compliance_csv, path)
+
+    def reset_database(self):
+        if not self.ask_yes_no("Reset Database", "Wipe EVERYTHING and start fresh? This cannot be undone."):
+            return
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+        try:
+            if os.path.exists(DB_PATH):
+                os.remove(DB_PATH)
+        except Exception as e:
+            self.show_error(f"Could not remove database file: {str(e)}")
+            self.conn = connect_db()
+            create_tables(self.conn)
+            return
+
+        self.conn = connect_db()
+        create_tables(self.conn)
+        self.undo_stack.clear()
+        self.refresh_all()
+        self.rebuild_completers()
+        self.update_status("Database reset")
+
+    def zoom_in(self):
+        self.current_zoom = min(200, self.current_zoom + 10)
+        self.current_font_size = int(12 * (self.current_zoom / 100))
+        self.setup_colors()
+        self.update_status("Zoom updated")
+
+    def zoom_out(self):
+        self.current_zoom = max(50, self.current_zoom - 10)
+        self.current_font_size = int(12 * (self.current_zoom / 100))
+        self.setup_colors()
+        self.update_status("Zoom updated")
+
+    def reset_zoom(self):
+        self.current_zoom = 100
+        self.current_font_size = 12
+        self.setup_colors()
+        self.update_status("Zoom reset")
+
+    def enable_high_contrast_mode(self, enable):
+        self.high_contrast_mode = enable
+        self.setup_colors()
+        mode = "High Contrast" if enable else "Normal"
+        self.update_status(f"{mode} Mode enabled")
+
+    def show_keyboard_help(self):
+        help_text = """
+KEYBOARD SHORTCUTS
+
+General:
+• Tab / Shift+Tab: Move focus
+• Enter: Activate button / confirm
+• Ctrl+Z: Undo
+• Ctrl+I: Inventory Viewer
+• Ctrl+M: Compliance Manager
+• F11: Fullscreen
+
+Accessibility:
+• Ctrl+= : Zoom in
+• Ctrl+- : Zoom out
+• Ctrl+0 : Reset zoom
+"""
+        QMessageBox.information(self, "Keyboard Help", help_text)
+
+    # STUDENTS MENU
+    def create_students_tab(self):
+        tab = QWidget()
+        self.tabs.addTab(tab, "Students")
+        layout = QVBoxLayout(tab)
+
+        header = QHBoxLayout()
+        title = QLabel("Roster")
+        title.setStyleSheet("font-weight: bold; padding: 0px; margin: 0px;")
+        header.addWidget(title)
+        header.addStretch()
+        header.setSpacing(4)
+        header.setContentsMargins(0, 0, 0, 0)
+
+        layout.addLayout(header)
+
+        search_row = QHBoxLayout()
+        search_row.setSpacing(6)
+        search_row.setContentsMargins(0, 0, 0, 0)
+
+        self.student_search = QLineEdit()
+        self.student_search.setPlaceholderText("Search roster… (ID, name, section, instrument)")
+        self.student_search.textChanged.connect(lambda _: self._roster_filter_timer.start())
+        search_row.addWidget(self.student_search)
+
+        self._roster_filter_timer = QTimer(self)
+        self._roster_filter_timer.setSingleShot(True)
+        self._roster_filter_timer.setInterval(180)
+        self._roster_filter_timer.timeout.connect(self.apply_roster_filter)
+
+        self.active_only = QCheckBox("Active only")
+        self.active_only.setChecked(True)
+        self.active_only.stateChanged.connect(self.load_students)
+        search_row.addWidget(self.active_only)
+
+        layout.addLayout(search_row)
+
+        self.students_splitter = QSplitter(Qt.Horizontal)
+        layout.addWidget(self.students_splitter)
+
+        roster_wrap = QWidget()
+        roster_layout = QVBoxLayout(roster_wrap)
+        roster_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.students_model = StudentsModel(self)
+        self.students_proxy = QSortFilterProxyModel(self)
+        self.students_proxy.setSourceModel(self.students_model)
+        self.students_proxy.setFilterKeyColumn(-1)
+        self.students_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.students_table = QTableView()
+        self.students_table.setModel(self.students_proxy)
+        self.students_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.students_table.setAlternatingRowColors(True)
+        self.students_table.verticalHeader().setVisible(False)
+        self.students_table.horizontalHeader().setStretchLastSection(True)
+        self.students_table.setWordWrap(False)
+        self.students_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.students_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.students_table.selectionModel().selectionChanged.connect(
+            lambda *_: self.on_student_selected())
+        self.students_table.setShowGrid(True)
+
+        # Fixed section sizes: resizeColumnsToContents measures every cell's
+        # text on each refresh, an O(rows x cols) pass the view never needs.
+        hdr = self.students_table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate([90, 110, 110, 95, 115, 130, 60, 60, 65, 70]):
+            hdr.resizeSection(i, width)
+        roster_layout.addWidget(self.students_table)
+
+        roster_controls = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_students)
+        roster_controls.addWidget(refresh_btn)
+
+        self.find_id = QLineEdit()
+        self.find_id.setPlaceholderText("Type ID to jump…")
+        self.find_id.returnPressed.connect(self.jump_to_student)
+        roster_controls.addWidget(self.find_id)
+
+        delete_btn = QPushButton("Delete Selected")
+        delete_btn.clicked.connect(self.delete_student)
+        roster_controls.addWidget(delete_btn)
+
+        roster_controls.addStretch()
+        roster_layout.addLayout(roster_controls)
+
+        forms_wrap = QWidget()
+        forms_layout = QVBoxLayout(forms_wrap)
+        forms_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.student_forms_tabs = QTabWidget()
+        forms_layout.addWidget(self.student_forms_tabs)
+
+        add_tab = QWidget()
+        add_layout = QHBoxLayout(add_tab)
+
+        add_group = QGroupBox("Add Student")
+        add_form = QFormLayout(add_group)
+
+        self.add_id = QLineEdit()
+        self.add_id.setPlaceholderText("Student ID")
+        self.add_id.textChanged.connect(lambda: self.validate_required(self.add_id))
+        add_form.addRow("Student ID*:", self.add_id)
+
+        self.add_first = QLineEdit()
+        add_form.addRow("First Name*:", self.add_first)
+
+        self.add_last = QLineEdit()
+        add_form.addRow("Last Name*:", self.add_last)
+
+        self.add_class = QComboBox()
+        self.add_class.addItems(CLASSIFICATIONS)
+        add_form.addRow("Class:", self.add_class)
+
+        self.add_section = QComboBox()
+        self.add_section.addItems(SECTIONS)
+        add_form.addRow("Section*:", self.add_section)
+
+        self.add_role = QComboBox()
+        self.add_role.addItems([""] + [x[0] for x in INSTRUMENT_CATALOG] + ["DRUM MAJOR", "OTHER"])
+        add_form.addRow("Instrument:", self.add_role)
+
+        self.add_shirt = QComboBox()
+        self.add_shirt.addItems(SHIRT_SIZES)
+        add_form.addRow("Shirt Size:", self.add_shirt)
+
+        self.add_shoe = QComboBox()
+        self.add_shoe.addItems(SHOE_SIZES)
+        add_form.addRow("Shoe Size:", self.add_shoe)
+
+        self.add_active = QCheckBox("Active")
+        self.add_active.setChecked(True)
+        add_form.addRow("", self.add_active)
+
+        add_btn = QPushButton("Add")
+        add_btn.clicked.connect(self.add_student)
+        add_form.addRow(add_btn)
+
+        add_layout.addWidget(add_group)
+        add_layout.addStretch()
+        self.student_forms_tabs.addTab(add_tab, "Add")
+
+        edit_tab = QWidget()
+        edit_layout = QHBoxLayout(edit_tab)
+
+        edit_group = QGroupBox("Edit Selected Student")
+        edit_form = QFormLayout(edit_group)
+
+        self.edit_id_readonly = QLineEdit()
+        self.edit_id_readonly.setReadOnly(True)
+        edit_form.addRow("Student ID:", self.edit_id_readonly)
+
+        self.edit_first = QLineEdit()
+        edit_form.addRow("First Name*:", self.edit_first)
+
+        self.edit_last = QLineEdit()
+        edit_form.addRow("Last Name*:", self.edit_last)
+
+        self.edit_class = QComboBox()
+        self.edit_class.addItems(CLASSIFICATIONS)
+        edit_form.addRow("Class:", self.edit_class)
+
+        self.edit_section = QComboBox()
+        self.edit_section.addItems(SECTIONS)
+        edit_form.addRow("Section*:", self.edit_section)
+
+        self.edit_role = QComboBox()
+        self.edit_role.addItems([""] + [x[0] for x in INSTRUMENT_CATALOG] + ["DRUM MAJOR", "OTHER"])
+        edit_form.addRow("Instrument:", self.edit_role)
+
+        self.edit_shirt = QComboBox()
+        self.edit_shirt.addItems(SHIRT_SIZES)
+        edit_form.addRow("Shirt Size:", self.edit_shirt)
+
+        self.edit_shoe = QComboBox()
+        self.edit_shoe.addItems(SHOE_SIZES)
+        edit_form.addRow("Shoe Size:", self.edit_shoe)
+
+        self.edit_active = QCheckBox("Active")
+        edit_form.addRow("", self.edit_active)
+
+        self.edit_save = QPushButton("Save Changes")
+        self.edit_save.setEnabled(False)
+        self.edit_save.clicked.connect(self.save_student_edits)
+        edit_form.addRow(self.edit_save)
+
+        edit_layout.addWidget(edit_group)
+        edit_layout.addStretch()
+        self.student_forms_tabs.addTab(edit_tab, "Edit")
+        self.student_forms_tabs.currentChanged.connect(self._on_forms_tab_changed)
+
+        self.students_splitter.addWidget(roster_wrap)
+        self.students_splitter.addWidget(forms_wrap)
+        self.students_splitter.setSizes([850, 450])
+
+        self.students_splitter.setHandleWidth(10)
+        self.students_splitter.setChildrenCollapsible(True)
+        self.students_splitter.setSizes([500, 250])
+
+        self.students_splitter.setStretchFactor(0, 4)
+        self.students_splitter.setStretchFactor(1, 2)
+
+        self.apply_shadow(add_group)
+        self.apply_shadow(edit_group)
+
+        self.build_students_columns_menu()
+
+    def build_students_columns_menu(self):
+        self.students_columns_menu.clear()
+        self.students_col_actions.clear()
+
+        names = StudentsModel.HEADERS
+        for idx, name in enumerate(names):
+            act = QAction(name, self)
+            act.setCheckable(True)
+            act.setChecked(True)
+            act.setData(idx)
+            act.toggled.connect(self._toggle_student_column)
+            self.students_columns_menu.addAction(act)
+            self.students_col_actions[idx] = act
+
+        default_hide = ["Shirt", "Shoe"]
+        for idx, act in self.students_col_actions.items():
+            if act.text() in default_hide:
+                act.setChecked(False)
+
+    def _toggle_student_column(self, checked):
+        self.students_table.setColumnHidden(self.sender().data(), not checked)
+
+    def apply_roster_filter(self):
+        q = self.student_search.text().strip()
+        if q:
+            # The proxy can only match rows the source model has materialized.
+            while self.students_model.canFetchMore():
+                self.students_model.fetchMore()
+        self.students_proxy.setFilterFixedString(q)
+        # With no filter the proxy only counts the fetched pages, so report
+        # the model's full total instead.
+        count = self.students_proxy.rowCount() if q else self.students_model.total_rows()
+        self.update_status(f"Showing {count} students")
+
+    def load_students(self):
+        sql = SQL_ROSTER_ACTIVE if self.active_only.isChecked() else SQL_ROSTER_ALL
+        rows = self.conn.execute(sql).fetchall()
+        self._loaded_edit_sid = None
+        self.students_model.set_rows(rows)
+        self.update_status(f"Loaded {len(rows)} students")
+
+    def jump_to_student(self):
+        sid = self.find_id.text().strip()
+        if not sid.isdigit():
+            self.show_error("Enter a valid numeric ID")
+            return
+        model = self.students_model
+        r = model.row_for_sid(int(sid))
+        if r is not None:
+            while model.canFetchMore() and r >= model.rowCount():
+                model.fetchMore()
+            proxy_index = self.students_proxy.mapFromSource(model.index(r, 0))
+            if proxy_index.isValid():
+                self.students_table.selectRow(proxy_index.row())
+                self.students_table.scrollTo(proxy_index, QAbstractItemView.PositionAtCenter)
+                return
+        self.show_error("Student not found in current view")
+
+    def on_student_selected(self):
+        index = self.students_table.currentIndex()
+        row = self.students_proxy.mapToSource(index).row() if index.isValid() else -1
+        if row < 0:
+            self._pending_edit_sid = None
+            self.edit_id_readonly.clear()
+            self.edit_save.setEnabled(False)
+            return
+
+        # Populating the edit form is deferred until that tab is actually
+        # visible; browsing the roster just records the selected ID.
+        self._pending_edit_sid = self.students_model.row(row)[0]
+        if self.student_forms_tabs.currentIndex() == self.EDIT_TAB_INDEX:
+            self._refresh_edit_form()
+
+    def _on_forms_tab_changed(self, index):
+        if index == self.EDIT_TAB_INDEX:
+            self._refresh_edit_form()
+
+    def _refresh_edit_form(self):
+        sid = self._pending_edit_sid
+        if sid is None or sid == self._loaded_edit_sid:
+            return
+        cur = self.conn.execute("""
+            SELECT STUDENT_ID, FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''), COALESCE(PRIMARY_ROLE,''),
+                   COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1)
+            FROM STUDENTS
+            WHERE STUDENT_ID=?
+        """, (sid,))
+        s = cur.fetchone()
+        if not s:
+            return
+
+        self.edit_id_readonly.setText(str(s[0]))
+        self.edit_first.setText(s[1])
+        self.edit_last.setText(s[2])
+
+        self.edit_class.setCurrentText(s[3] if s[3] in CLASSIFICATIONS else "")
+        self.edit_section.setCurrentText(s[4] if s[4] in SECTIONS else "OTHER")
+
+        role_texts = [self.edit_role.itemText(i) for i in range(self.edit_role.count())]
+        self.edit_role.setCurrentText(s[5] if s[5] in role_texts else "")
+
+        self.edit_shirt.setCurrentText(s[6] if s[6] in SHIRT_SIZES else "")
+        self.edit_shoe.setCurrentText(s[7] if s[7] in SHOE_SIZES else "")
+        self.edit_active.setChecked(True if s[8] == 1 else False)
+
+        self.edit_save.setEnabled(True)
+        self._loaded_edit_sid = sid
+
+    def add_student(self):
+        ok_id = self.validate_required(self.add_id)
+        ok_fn = bool(self.add_first.text().strip())
+        ok_ln = bool(self.add_last.text().strip())
+
+        if not ok_id:
+            self.show_error("Student ID is required")
+            return
+        if not ok_fn or not ok_ln:
+            self.show_error("First and Last name are required")
+            return
+
+        sid_txt = self.add_id.text().strip()
+        if not sid_txt.isdigit():
+            self.show_error("Student ID must be numeric")
+            self.add_id.setStyleSheet("border: 2px solid #e74c3c;")
+            return
+
+        sid = int(sid_txt)
+
+        if check_student_exists(self.conn, sid):
+            self.show_error("Student ID already exists")
+            self.add_id.setStyleSheet("border: 2px solid #e74c3c;")
+            return
+
+        fn = self.add_first.text().strip()
+        ln = self.add_last.text().strip()
+        cl = self.add_class.currentText()
+        sec = self.add_section.currentText()
+        role = self.add_role.currentText().strip() or None
+        shirt = self.add_shirt.currentText().strip() or None
+        shoe = self.add_shoe.currentText().strip() or None
+        active = 1 if self.add_active.isChecked() else 0
+        updated = self._today
+
+        ops = [
+            ("INSERT INTO STUDENTS (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+             (sid, fn, ln, cl, sec, role, shirt, shoe, active, updated)),
+            ("INSERT OR IGNORE INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, 0, 0.0, 0, ?)",
+             (sid, updated))
+        ]
+        undo_ops = [
+            ("DELETE FROM STUDENTS WHERE STUDENT_ID=?", (sid,))
+        ]
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            apply_ops(self.conn, ops)
+            self.conn.commit()
+            self.push_undo_ops("Add Student", undo_ops)
+
+            self.add_id.clear()
+            self.add_first.clear()
+            self.add_last.clear()
+            self.add_class.setCurrentIndex(0)
+            self.add_section.setCurrentIndex(0)
+            self.add_role.setCurrentIndex(0)
+            self.add_shirt.setCurrentIndex(0)
+            self.add_shoe.setCurrentIndex(0)
+            self.add_active.setChecked(True)
+
+            self.refresh_all()
+            self.rebuild_completers()
+            self.update_status("Student added")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def save_student_edits(self):
+        sid_txt = self.edit_id_readonly.text().strip()
+        if not sid_txt.isdigit():
+            return
+        sid = int(sid_txt)
+
+        fn = self.edit_first.text().strip()
+        ln = self.edit_last.text().strip()
+        if not fn or not ln:
+            self.show_error("First and Last name are required")
+            return
+
+        cl = self.edit_class.currentText()
+        sec = self.edit_section.currentText()
+        role = self.edit_role.currentText().strip() or None
+        shirt = self.edit_shirt.currentText().strip() or None
+        shoe = self.edit_shoe.currentText().strip() or None
+        active = 1 if self.edit_active.isChecked() else 0
+        updated = self._today
+
+        cur = self.conn.execute("""
+            SELECT FNAME, LNAME, COALESCE(CLASSIFICATION,''), COALESCE(SECTION,''), COALESCE(PRIMARY_ROLE,''),
+                   COALESCE(SHIRT_SIZE,''), COALESCE(SHOE_SIZE,''), COALESCE(ACTIVE,1), COALESCE(UPDATED_AT,'')
+            FROM STUDENTS WHERE STUDENT_ID=?
+        """, (sid,))
+        old = cur.fetchone()
+        if not old:
+            return
+
+        new_vals = {"FNAME": fn, "LNAME": ln, "CLASSIFICATION": cl, "SECTION": sec,
+                    "PRIMARY_ROLE": role, "SHIRT_SIZE": shirt, "SHOE_SIZE": shoe,
+                    "ACTIVE": active}
+        old_vals = {"FNAME": old[0], "LNAME": old[1], "CLASSIFICATION": old[2], "SECTION": old[3],
+                    "PRIMARY_ROLE": old[4] or None, "SHIRT_SIZE": old[5] or None,
+                    "SHOE_SIZE": old[6] or None, "ACTIVE": old[7]}
+
+        changed = [c for c in new_vals if new_vals[c] != old_vals[c]]
+        if not changed:
+            self.update_status("No changes to save")
+            return
+
+        # Only the changed columns go into the UPDATE and the undo record.
+        new_vals["UPDATED_AT"] = updated
+        old_vals["UPDATED_AT"] = old[8]
+        changed.append("UPDATED_AT")
+
+        sql = f"UPDATE STUDENTS SET {', '.join(c + '=?' for c in changed)} WHERE STUDENT_ID=?"
+        ops = [(sql, tuple(new_vals[c] for c in changed) + (sid,))]
+        undo_ops = [(sql, tuple(old_vals[c] for c in changed) + (sid,))]
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            apply_ops(self.conn, ops)
+            self.conn.commit()
+            self.push_undo_ops("Edit Student", undo_ops)
+            self.refresh_all()
+            self.update_status("Student updated")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def delete_student(self):
+        index = self.students_table.currentIndex()
+        row = self.students_proxy.mapToSource(index).row() if index.isValid() else -1
+        if row < 0:
+            self.show_error("Select a student first")
+            return
+
+        r = self.students_model.row(row)
+        sid = r[0]
+        name = f"{r[1]} {r[2]}"
+
+        if not self.ask_yes_no("Confirm Delete", f"Delete {name} (ID: {sid})?"):
+            return
+
+        try:
+            # Every write captures its own undo pre-image via RETURNING,
+            # all under one write transaction.  The held items are released
+            # explicitly (rather than left to the SET NULL cascade) so the
+            # old assignment columns come back with the update.
+            self.conn.execute("BEGIN IMMEDIATE")
+            instr_hold = self.conn.execute(SQL_RELEASE_INSTRUMENT, (sid,)).fetchone()
+            uni_hold = self.conn.execute(SQL_RELEASE_UNIFORM, (sid,)).fetchone()
+            shako_hold = self.conn.execute(SQL_RELEASE_SHAKO, (sid,)).fetchone()
+            compliance = self.conn.execute(SQL_DELETE_COMPLIANCE, (sid,)).fetchone()
+            student = self.conn.execute(SQL_DELETE_STUDENT, (sid,)).fetchone()
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+            return
+
+        undo_ops = []
+
+        if student:
+            undo_ops.append((
+                "INSERT INTO STUDENTS (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(STUDENT_ID) DO UPDATE SET FNAME=excluded.FNAME, LNAME=excluded.LNAME, CLASSIFICATION=excluded.CLASSIFICATION, SECTION=excluded.SECTION, PRIMARY_ROLE=excluded.PRIMARY_ROLE, SHIRT_SIZE=excluded.SHIRT_SIZE, SHOE_SIZE=excluded.SHOE_SIZE, ACTIVE=excluded.ACTIVE, UPDATED_AT=excluded.UPDATED_AT",
+                (student[0], student[1], student[2], student[3], student[4], student[5] or None, student[6] or None, student[7] or None, student[8], student[9])
+            ))
+
+        if compliance:
+            undo_ops.append((
+                "INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(STUDENT_ID) DO UPDATE SET CREDIT_HOURS=excluded.CREDIT_HOURS, GPA=excluded.GPA, DUES_PAID=excluded.DUES_PAID, LAST_VERIFIED_DATE=excluded.LAST_VERIFIED_DATE",
+                (compliance[0], compliance[1], compliance[2], compliance[3], compliance[4])
+            ))
+
+        if instr_hold:
+            undo_ops.append((
+                "UPDATE INSTRUMENTS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE INSTRUMENT_ID=?",
+                (sid, instr_hold[1] or None, instr_hold[2] or None, instr_hold[0])
+            ))
+
+        if uni_hold:
+            undo_ops.append((
+                "UPDATE UNIFORMS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE UNIFORM_ID=?",
+                (sid, uni_hold[1] or None, uni_hold[2] or None, uni_hold[0])
+            ))
+
+        if shako_hold:
+            undo_ops.append((
+                "UPDATE SHAKOS SET CHECKED_OUT_TO=?, CHECKED_OUT_DATE=?, CONDITION_NOTES=? WHERE SHAKO_ID=?",
+                (sid, shako_hold[1] or None, shako_hold[2] or None, shako_hold[0])
+            ))
+
+        self.push_undo_ops("Delete Student", undo_ops)
+        self.refresh_all()
+        self.rebuild_completers()
+        self.update_status("Student deleted")
+
+    # UNIFORM MENU
+    def create_uniforms_tab(self):
+        tab = QWidget()
+        self.tabs.addTab(tab, "Uniforms")
+        layout = QVBoxLayout(tab)
+
+        layout.setSpacing(6)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        top = QHBoxLayout()
+        self.uniform_search = QLineEdit()
+        self.uniform_search.setPlaceholderText("Search uniforms…")
+        self._uniform_search_timer = QTimer(self)
+        self._uniform_search_timer.setSingleShot(True)
+        self._uniform_search_timer.setInterval(150)
+        self._uniform_search_timer.timeout.connect(self.apply_uniform_filter)
+        self.uniform_search.textChanged.connect(lambda _: self._uniform_search_timer.start())
+        top.addWidget(self.uniform_search)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_uniforms)
+        top.addWidget(refresh_btn)
+        layout.addLayout(top)
+
+       
+        self.uniforms_model = TupleTableModel([
+            "ID", "Coat Size", "Pant Size", "Coat #", "Pant #",
+            "Condition", "Assigned To", "Date", "Available"
+        ], self)
+        self.uniforms_proxy = QSortFilterProxyModel(self)
+        self.uniforms_proxy.setSourceModel(self.uniforms_model)
+        self.uniforms_proxy.setFilterKeyColumn(-1)
+        self.uniforms_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.uniforms_table = QTableView()
+        self.uniforms_table.setModel(self.uniforms_proxy)
+        self.uniforms_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.uniforms_table.setAlternatingRowColors(True)
+        self.uniforms_table.verticalHeader().setVisible(False)
+        self.uniforms_table.horizontalHeader().setStretchLastSection(True)
+        self.uniforms_table.setWordWrap(False)
+        self.uniforms_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.uniforms_table.setShowGrid(True)
+        hdr = self.uniforms_table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate([50, 85, 85, 70, 70, 160, 95, 95, 75]):
+            hdr.resizeSection(i, width)
+        layout.addWidget(self.uniforms_table)
+
+        forms_row = QHBoxLayout()
+        forms_row.setSpacing(12)
+
+        add_card = QFrame()
+        add_card.setObjectName("card")
+        add_card_layout = QVBoxLayout(add_card)
+        add_card_layout.setContentsMargins(12, 12, 12, 12)
+
+        add_group = QGroupBox("Add Uniform")
+        add_group.setStyleSheet("border: none;")  
+        add_form = QFormLayout(add_group)
+
+        self.coat_size = QLineEdit()
+        add_form.addRow("Coat Size:", self.coat_size)
+
+        self.pant_size = QLineEdit()
+        add_form.addRow("Pant Size:", self.pant_size)
+
+        self.coat_number = QLineEdit()
+        add_form.addRow("Coat #:", self.coat_number)
+
+        self.pant_number = QLineEdit()
+        add_form.addRow("Pant #:", self.pant_number)
+
+        self.uniform_condition = QLineEdit()
+        add_form.addRow("Condition:", self.uniform_condition)
+
+        add_btn = QPushButton("Add")
+        add_btn.clicked.connect(self.add_uniform)
+        add_form.addRow(add_btn)
+
+        add_card_layout.addWidget(add_group)
+        self.apply_shadow(add_card)
+
+        assign_card = QFrame()
+        assign_card.setObjectName("card")
+        assign_card_layout = QVBoxLayout(assign_card)
+        assign_card_layout.setContentsMargins(12, 12, 12, 12)
+
+        assign_group = QGroupBox("Assign / Unassign")
+        assign_group.setStyleSheet("border: none;")
+        assign_form = QFormLayout(assign_group)
+
+        self.assign_uni_student = QLineEdit()
+        self.assign_uni_student.setPlaceholderText("Student ID")
+        self.assign_uni_student.textChanged.connect(
+            lambda: self.show_student_preview(self.assign_uni_student, self.uni_preview)
+        )
+        assign_form.addRow("Student ID*:", self.assign_uni_student)
+
+        self.uni_preview = QLabel("")
+        assign_form.addRow("Student:", self.uni_preview)
+
+        assign_btn = QPushButton("Assign")
+        assign_btn.clicked.connect(self.assign_uniform)
+        assign_form.addRow(assign_btn)
+
+        unassign_btn = QPushButton("Unassign")
+        unassign_btn.clicked.connect(self.unassign_uniform)
+        assign_form.addRow(unassign_btn)
+
+        assign_card_layout.addWidget(assign_group)
+        self.apply_shadow(assign_card)
+
+        forms_row.addWidget(add_card)
+        forms_row.addWidget(assign_card)
+        layout.addLayout(forms_row)
+
+    def apply_uniform_filter(self):
+        q = self.uniform_search.text().strip()
+        if q:
+            # The proxy can only match rows the source model has materialized.
+            while self.uniforms_model.canFetchMore():
+                self.uniforms_model.fetchMore()
+        self.uniforms_proxy.setFilterFixedString(q)
+        count = self.uniforms_proxy.rowCount() if q else self.uniforms_model.total_rows()
+        self.update_status(f"Showing {count} uniforms")
+
+    def load_uniforms(self):
+        # Same constant the inventory dialog uses; the extra summary column
+        # past the header count is simply never displayed.  Search text is
+        # applied client-side by the proxy, not here.
+        rows = self.conn.execute(_UNIFORM_SQL_ALL).fetchall()
+        self.uniforms_model.set_rows(rows)
+        self.update_status(f"Loaded {len(rows)} uniforms")
+
+    def add_uniform(self):
+        coat = self.coat_size.text().strip() or None
+        pant = self.pant_size.text().strip() or None
+        coatn = self.coat_number.text().strip() or None
+        pantn = self.pant_number.text().strip() or None
+        cond = self.uniform_condition.text().strip() or None
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            cur = self.conn.execute(
+                "INSERT INTO UNIFORMS (COAT_SIZE, PANT_SIZE, COAT_NUMBER, PANT_NUMBER, CONDITION_NOTES) VALUES (?, ?, ?, ?, ?)",
+                (coat, pant, coatn, pantn, cond)
+            )
+            uid = cur.lastrowid
+            self.conn.commit()
+            self.push_undo_ops("Add Uniform", [("DELETE FROM UNIFORMS WHERE UNIFORM_ID=?", (uid,))])
+
+            self.coat_size.clear()
+            self.pant_size.clear()
+            self.coat_number.clear()
+            self.pant_number.clear()
+            self.uniform_condition.clear()
+
+            self.load_uniforms()
+            self.update_status("Uniform added")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def get_selected_uniform_id(self):
+        index = self.uniforms_table.currentIndex()
+        row = self.uniforms_proxy.mapToSource(index).row() if index.isValid() else -1
+        if row < 0:
+            return None
+        return self.uniforms_model.row(row)[0]
+
+    def show_student_preview(self, field, label):
+        if not hasattr(self, "_preview_timer"):
+            self._preview_timer = QTimer(self)
+            self._preview_timer.setSingleShot(True)
+            self._preview_timer.setInterval(150)
+            self._preview_timer.timeout.connect(self._refresh_student_preview)
+        self._preview_target = (field, label)
+        self._preview_timer.start()
+
+    def _refresh_student_preview(self):
+        field, label = self._preview_target
+        txt = field.text().strip()
+        if not txt.isdigit():
+            label.setText("")
+            return
+        sid = int(txt)
+        # Membership test first: partial IDs miss the set in O(1), no SQL.
+        if sid not in self._student_ids:
+            label.setText("")
+            return
+        name = self._student_name_cache.get(sid)
+        if name is None:
+            name = get_student_name(self.conn, sid)
+            self._student_name_cache[sid] = name
+        label.setText(name)
+
+    def _do_assign(self, kind):
+        selector, field, preview, reloads = self._equipment[kind]
+        eid = selector()
+        if not eid:
+            self.show_error(f"Select a {kind} first")
+            return
+
+        if not self.validate_required(field):
+            self.show_error("Student ID is required")
+            return
+
+        sid_txt = field.text().strip()
+        if not sid_txt.isdigit():
+            self.show_error("Student ID must be numeric")
+            return
+        sid = int(sid_txt)
+
+        if kind == "instrument":
+            ctx = fetch_assign_context(self.conn, sid, eid)
+            if ctx is None or ctx[0] is None:
+                self.show_error("Student not found")
+                return
+            _found, student_section, instr_section = ctx
+            if instr_section and student_section and instr_section != student_section:
+                if not self.ask_yes_no("Section mismatch", f"Instrument section is {instr_section} but student section is {student_section}. Assign anyway?"):
+                    return
+        elif not check_student_exists(self.conn, sid):
+            self.show_error("Student not found")
+            return
+
+        cond, ok = QInputDialog.getText(self, "Condition", "Condition notes (optional):")
+        if not ok:
+            return
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            row = self.conn.execute(_EQUIP_ASSIGN_SQL[kind],
+                                    (sid, self._today, eid)).fetchone()
+            if row is None:
+                self.conn.rollback()
+                self.show_error(f"That {kind} is already assigned")
+                return
+            old_cond = row[0]
+            if cond.strip():
+                self.conn.execute(_EQUIP_NOTES_SQL[kind], (cond.strip(), eid))
+            self.conn.commit()
+
+            undo_ops = [(_EQUIP_RESTORE_SQL[kind], (None, None, old_cond or None, eid))]
+            self.push_undo_ops(f"Assign {kind.capitalize()}", undo_ops)
+
+            field.clear()
+            preview.setText("")
+            for reload_fn in reloads:
+                reload_fn()
+            self.update_status(f"{kind.capitalize()} assigned")
+        except sqlite3.IntegrityError:
+            self.conn.rollback()
+            self.show_error(f"Student can only hold one {kind}")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def _do_unassign(self, kind):
+        selector, _field, _preview, reloads = self._equipment[kind]
+        eid = selector()
+        if not eid:
+            self.show_error(f"Select a {kind} first")
+            return
+
+        cond, ok = QInputDialog.getText(self, "Condition Update", "Condition notes after return (optional):")
+        if not ok:
+            return
+
+        try:
+            # Snapshot and release under one write lock so the pre-image the
+            # undo record keeps is exactly what the UPDATE cleared.
+            self.conn.execute("BEGIN IMMEDIATE")
+            old_to, old_date, old_cond = self.conn.execute(_EQUIP_HOLD_SQL[kind], (eid,)).fetchone()
+            if not old_to:
+                self.conn.rollback()
+                self.show_error(f"That {kind} is not assigned")
+                return
+
+            new_cond = cond.strip() or old_cond or None
+            self.conn.execute(_EQUIP_UNASSIGN_SQL[kind], (new_cond, eid))
+            self.conn.commit()
+
+            undo_ops = [(_EQUIP_RESTORE_SQL[kind], (old_to, old_date, old_cond or None, eid))]
+            self.push_undo_ops(f"Unassign {kind.capitalize()}", undo_ops)
+
+            for reload_fn in reloads:
+                reload_fn()
+            self.update_status(f"{kind.capitalize()} unassigned")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def assign_uniform(self):
+        self._do_assign("uniform")
+
+    def unassign_uniform(self):
+        self._do_unassign("uniform")
+
+    def create_shakos_tab(self):
+        tab = QWidget()
+        self.tabs.addTab(tab, "Shakos")
+        layout = QVBoxLayout(tab)
+
+        top = QHBoxLayout()
+        self.shako_search = QLineEdit()
+        self.shako_search.setPlaceholderText("Search shakos…")
+        self._shako_search_timer = QTimer(self)
+        self._shako_search_timer.setSingleShot(True)
+        self._shako_search_timer.setInterval(150)
+        self._shako_search_timer.timeout.connect(self.apply_shako_filter)
+        self.shako_search.textChanged.connect(lambda _: self._shako_search_timer.start())
+        top.addWidget(self.shako_search)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_shakos)
+        top.addWidget(refresh_btn)
+        layout.addLayout(top)
+
+        self.shakos_model = TupleTableModel([
+            "ID", "Size", "Condition", "Assigned To", "Date", "Available"
+        ], self)
+        self.shakos_proxy = QSortFilterProxyModel(self)
+        self.shakos_proxy.setSourceModel(self.shakos_model)
+        self.shakos_proxy.setFilterKeyColumn(-1)
+        self.shakos_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.shakos_table = QTableView()
+        self.shakos_table.setModel(self.shakos_proxy)
+        self.shakos_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.shakos_table.setAlternatingRowColors(True)
+        self.shakos_table.verticalHeader().setVisible(False)
+        self.shakos_table.horizontalHeader().setStretchLastSection(True)
+        self.shakos_table.setWordWrap(False)
+        self.shakos_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.shakos_table.setShowGrid(True)
+        hdr = self.shakos_table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate([50, 80, 180, 95, 95, 75]):
+            hdr.resizeSection(i, width)
+        layout.addWidget(self.shakos_table)
+
+        forms_row = QHBoxLayout()
+
+        add_group = QGroupBox("Add Shako")
+        add_form = QFormLayout(add_group)
+
+        self.shako_size = QLineEdit()
+        add_form.addRow("Size:", self.shako_size)
+
+        self.shako_condition = QLineEdit()
+        add_form.addRow("Condition:", self.shako_condition)
+
+        add_btn = QPushButton("Add")
+        add_btn.clicked.connect(self.add_shako)
+        add_form.addRow(add_btn)
+
+        assign_group = QGroupBox("Assign / Unassign")
+        assign_form = QFormLayout(assign_group)
+
+        self.assign_shako_student = QLineEdit()
+        self.assign_shako_student.setPlaceholderText("Student ID")
+        self.assign_shako_student.textChanged.connect(lambda: self.show_student_preview(self.assign_shako_student, self.shako_preview))
+        assign_form.addRow("Student ID*:", self.assign_shako_student)
+
+        self.shako_preview = QLabel("")
+        assign_form.addRow("Student:", self.shako_preview)
+
+        assign_btn = QPushButton("Assign")
+        assign_btn.clicked.connect(self.assign_shako)
+        assign_form.addRow(assign_btn)
+
+        unassign_btn = QPushButton("Unassign")
+        unassign_btn.clicked.connect(self.unassign_shako)
+        assign_form.addRow(unassign_btn)
+
+        forms_row.addWidget(add_group)
+        forms_row.addWidget(assign_group)
+        layout.addLayout(forms_row)
+
+        self.apply_shadow(add_group)
+        self.apply_shadow(assign_group)
+
+    def apply_shako_filter(self):
+        q = self.shako_search.text().strip()
+        if q:
+            # The proxy can only match rows the source model has materialized.
+            while self.shakos_model.canFetchMore():
+                self.shakos_model.fetchMore()
+        self.shakos_proxy.setFilterFixedString(q)
+        count = self.shakos_proxy.rowCount() if q else self.shakos_model.total_rows()
+        self.update_status(f"Showing {count} shakos")
+
+    def load_shakos(self):
+        rows = self.conn.execute(_SHAKO_SQL_ALL).fetchall()
+        self.shakos_model.set_rows(rows)
+        self.update_status(f"Loaded {len(rows)} shakos")
+
+    def add_shako(self):
+        size = self.shako_size.text().strip() or None
+        cond = self.shako_condition.text().strip() or None
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            cur = self.conn.execute("INSERT INTO SHAKOS (SIZE, CONDITION_NOTES) VALUES (?, ?)", (size, cond))
+            sid = cur.lastrowid
+            self.conn.commit()
+            self.push_undo_ops("Add Shako", [("DELETE FROM SHAKOS WHERE SHAKO_ID=?", (sid,))])
+
+            self.shako_size.clear()
+            self.shako_condition.clear()
+
+            self.load_shakos()
+            self.update_status("Shako added")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def get_selected_shako_id(self):
+        index = self.shakos_table.currentIndex()
+        row = self.shakos_proxy.mapToSource(index).row() if index.isValid() else -1
+        if row < 0:
+            return None
+        return self.shakos_model.row(row)[0]
+
+    def assign_shako(self):
+        self._do_assign("shako")
+
+    def unassign_shako(self):
+        self._do_unassign("shako")
+
+    def create_instruments_tab(self):
+        tab = QWidget()
+        self.tabs.addTab(tab, "Instruments")
+        layout = QVBoxLayout(tab)
+
+        top = QHBoxLayout()
+        self.instrument_search = QLineEdit()
+        self.instrument_search.setPlaceholderText("Search instruments… (type, serial, condition, assigned ID)")
+        self._instrument_search_timer = QTimer(self)
+        self._instrument_search_timer.setSingleShot(True)
+        self._instrument_search_timer.setInterval(150)
+        self._instrument_search_timer.timeout.connect(self.apply_instrument_filter)
+        self.instrument_search.textChanged.connect(lambda _: self._instrument_search_timer.start())
+        top.addWidget(self.instrument_search)
+
+        self.section_filter = QComboBox()
+        self.section_filter.addItems(["All Sections", "WOODWIND", "BRASS", "PERCUSSION"])
+        self.section_filter.currentIndexChanged.connect(self.load_instruments)
+        top.addWidget(self.section_filter)
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_instruments)
+        top.addWidget(refresh_btn)
+
+        layout.addLayout(top)
+
+        self.instruments_model = TupleTableModel([
+            "ID", "Type", "Section", "Serial", "Condition", "Assigned To", "Date", "Available"
+        ], self)
+        self.instruments_proxy = QSortFilterProxyModel(self)
+        self.instruments_proxy.setSourceModel(self.instruments_model)
+        self.instruments_proxy.setFilterKeyColumn(-1)
+        self.instruments_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.instruments_table = QTableView()
+        self.instruments_table.setModel(self.instruments_proxy)
+        self.instruments_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.instruments_table.setAlternatingRowColors(True)
+        self.instruments_table.verticalHeader().setVisible(False)
+        self.instruments_table.horizontalHeader().setStretchLastSection(True)
+        self.instruments_table.setWordWrap(False)
+        self.instruments_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.instruments_table.setShowGrid(True)
+        hdr = self.instruments_table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.Interactive)
+        for i, width in enumerate([50, 130, 110, 110, 150, 95, 95, 75]):
+            hdr.resizeSection(i, width)
+        layout.addWidget(self.instruments_table)
+
+        forms_row = QHBoxLayout()
+
+        add_group = QGroupBox("Add Instrument")
+        add_form = QFormLayout(add_group)
+
+        self.instrument_type_combo = QComboBox()
+        self.load_instrument_types()
+        add_form.addRow("Type*:", self.instrument_type_combo)
+
+        self.instrument_serial = QLineEdit()
+        add_form.addRow("Serial #:", self.instrument_serial)
+
+        self.instrument_notes = QLineEdit()
+        add_form.addRow("Condition:", self.instrument_notes)
+
+        add_btn = QPushButton("Add")
+        add_btn.clicked.connect(self.add_instrument)
+        add_form.addRow(add_btn)
+
+        assign_group = QGroupBox("Assign / Unassign")
+        assign_form = QFormLayout(assign_group)
+
+        self.assign_instr_student = QLineEdit()
+        self.assign_instr_student.setPlaceholderText("Student ID")
+        self.assign_instr_student.textChanged.connect(lambda: self.show_student_preview(self.assign_instr_student, self.instr_preview))
+        assign_form.addRow("Student ID*:", self.assign_instr_student)
+
+        self.instr_preview = QLabel("")
+        assign_form.addRow("Student:", self.instr_preview)
+
+        assign_btn = QPushButton("Assign")
+        assign_btn.clicked.connect(self.assign_instrument)
+        assign_form.addRow(assign_btn)
+
+        unassign_btn = QPushButton("Unassign")
+        unassign_btn.clicked.connect(self.unassign_instrument)
+        assign_form.addRow(unassign_btn)
+
+        forms_row.addWidget(add_group)
+        forms_row.addWidget(assign_group)
+        layout.addLayout(forms_row)
+
+        self.apply_shadow(add_group)
+        self.apply_shadow(assign_group)
+
+    def load_instrument_types(self):
+        self.instrument_type_combo.clear()
+        cur = self.conn.execute("SELECT TYPE_ID, TYPE_NAME, SECTION FROM INSTRUMENT_TYPES ORDER BY SECTION, TYPE_NAME")
+        for tid, name, sec in cur.fetchall():
+            self.instrument_type_combo.addItem(f"{name} ({sec})", tid)
+
+    def apply_instrument_filter(self):
+        q = self.instrument_search.text().strip()
+        if q:
+            # The proxy can only match rows the source model has materialized.
+            while self.instruments_model.canFetchMore():
+                self.instruments_model.fetchMore()
+        self.instruments_proxy.setFilterFixedString(q)
+        count = self.instruments_proxy.rowCount() if q else self.instruments_model.total_rows()
+        self.update_status(f"Showing {count} instruments")
+
+    def load_instruments(self):
+        # The section filter stays in SQL (it rides the composite index);
+        # free-text search is applied client-side by the proxy.
+        sec = self.section_filter.currentText()
+        filtered = sec != "All Sections"
+        rows = self.conn.execute(
+            _INSTR_SQL[(filtered, False)], (sec,) if filtered else ()).fetchall()
+        self.instruments_model.set_rows(rows)
+        self.update_status(f"Loaded {len(rows)} instruments")
+
+    def add_instrument(self):
+        tid = self.instrument_type_combo.currentData()
+        if not tid:
+            self.show_error("Select a type")
+            return
+
+        serial = self.instrument_serial.text().strip() or None
+        cond = self.instrument_notes.text().strip() or None
+
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            cur = self.conn.execute("INSERT INTO INSTRUMENTS (TYPE_ID, SERIAL, CONDITION_NOTES) VALUES (?, ?, ?)", (tid, serial, cond))
+            iid = cur.lastrowid
+            self.conn.commit()
+            self.push_undo_ops("Add Instrument", [("DELETE FROM INSTRUMENTS WHERE INSTRUMENT_ID=?", (iid,))])
+
+            self.instrument_serial.clear()
+            self.instrument_notes.clear()
+
+            self.load_instruments()
+            self.update_status("Instrument added")
+        except Exception as e:
+            self.conn.rollback()
+            self.show_error(f"Error: {str(e)}")
+
+    def get_selected_instrument_id(self):
+        index = self.instruments_table.currentIndex()
+        row = self.instruments_proxy.mapToSource(index).row() if index.isValid() else -1
+        if row < 0:
+            return None
+        return self.instruments_model.row(row)[0]
+
+    def assign_instrument(self):
+        self._do_assign("instrument")
+
+    def unassign_instrument(self):
+        self._do_unassign("instrument")
+
+    def _on_seed_done(self, error):
+        if error:
+            self.show_error(f"Sample data could not be seeded: {error}")
+        self.refresh_all()
+        self.rebuild_completers()
+
+    def _refresh_today(self):
+        # Today's ISO date, stamped on every mutation; recomputed once at
+        # midnight instead of per click.
+        self._today = date.today().isoformat()
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        QTimer.singleShot(int((midnight - now).total_seconds() * 1000) + 1000,
+                          self._refresh_today)
+
+    def refresh_all(self):
+        # Coalesce bursts (an undo chased by another mutation) into a single
+        # reload at the next event-loop turn.
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._student_name_cache.clear()
+        self.load_students()
+        self.load_uniforms()
+        self.load_shakos()
+        self.load_instruments()
+
+def seed_sample_data(conn):
+        """
+        Inserts sample data ONLY if the database is empty.
+        """
+        cur = conn.execute("SELECT EXISTS(SELECT 1 FROM STUDENTS)")
+        if cur.fetchone()[0]:
+            return  
+
+        # One transaction for the whole seed; the connection is in
+        # autocommit, which would otherwise commit every INSERT on its own.
+        conn.execute("BEGIN IMMEDIATE")
+
+        # Students 
+        students = [
+            (300819037, "Jordan", "Reed", "Freshman", "WOODWIND", "CLARINET", "M", "9",   1),
+            (300612467, "Ava",    "Lopez","Sophomore","BRASS",   "TRUMPET",  "S", "7.5", 1),
+            (300395193, "Miles",  "King", "Junior",   "PERCUSSION","SNARE DRUM","L","11",1),
+            (300518905, "Nia",    "Carter","Senior",  "FLAG CORP","OTHER",   "M", "8",   1),
+            (300135890, "Ethan",  "Park", "Junior",   "BRASS",   "TROMBONE", "XL","12",  1),
+            (300131935, "Zoe",    "Smith","Freshman", "WOODWIND","FLUTE",    "XS","6.5", 0),  
+        ]
+
+        today = date.today().isoformat()
+
+        conn.executemany(
+            """INSERT INTO STUDENTS
+            (STUDENT_ID, FNAME, LNAME, CLASSIFICATION, SECTION, PRIMARY_ROLE, SHIRT_SIZE, SHOE_SIZE, ACTIVE, UPDATED_AT)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [row + (today,) for row in students]
+        )
+
+        # Compliance
+        compliance = [
+            (300819037, 14, 3.20, 1, today),  # eligible
+            (300612467, 12, 2.85, 1, today),  # not eligible (gpa)
+            (300395193, 10, 3.50, 1, today),  # not eligible (credits)
+            (300518905, 15, 3.10, 0, today),  # not eligible (dues)
+            (300135890, 16, 3.70, 1, today),  # eligible
+            (300131935, 0,  0.00, 0, today),
+        ]
+        conn.executemany(
+            """INSERT INTO COMPLIANCE (STUDENT_ID, CREDIT_HOURS, GPA, DUES_PAID, LAST_VERIFIED_DATE)
+            VALUES (?, ?, ?, ?, ?)""",
+            compliance
+        )
+
+        # Instruments.  Seed assignments are known up front, so they ride
+        # the INSERT rows directly instead of a SELECT-back plus UPDATEs,
+        # and the type id resolves in-statement rather than via a dict.
+        instruments = [
+            ("CLARINET", "CL-44321", "Good pads", 300819037, today),
+            ("TRUMPET", "TR-88210", "Valve 2 sticky", 300612467, today),
+            ("SNARE DRUM", "SD-11007", "New head", None, None),
+            ("TROMBONE", "TB-23001", "Slide a bit tight", None, None),
+        ]
+        conn.executemany(
+            """INSERT INTO INSTRUMENTS (TYPE_ID, SERIAL, CONDITION_NOTES, CHECKED_OUT_TO, CHECKED_OUT_DATE)
+            VALUES ((SELECT TYPE_ID FROM INSTRUMENT_TYPES WHERE TYPE_NAME=?), ?, ?, ?, ?)""",
+            instruments
+        )
+
+        # Uniforms
+        uniforms = [
+            ("40R", "32", "C-101", "P-101", "Clean", 300395193, today),
+            ("38R", "30", "C-102", "P-102", "Minor tear", None, None),
+            ("42L", "34", "C-103", "P-103", "Needs dry clean", None, None),
+        ]
+        conn.executemany(
+            "INSERT INTO UNIFORMS (COAT_SIZE, PANT_SIZE, COAT_NUMBER, PANT_NUMBER, CONDITION_NOTES, CHECKED_OUT_TO, CHECKED_OUT_DATE) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            uniforms
+        )
+
+        # Shakos
+        shakos = [
+            ("7 1/4", "Good", 300518905, today),
+            ("7 3/8", "Needs plume", None, None),
+            ("7 1/2", "Scuffed brim", None, None),
+        ]
+        conn.executemany(
+            "INSERT INTO SHAKOS (SIZE, CONDITION_NOTES, CHECKED_OUT_TO, CHECKED_OUT_DATE) VALUES (?, ?, ?, ?)",
+            shakos
+        )
+
+        conn.execute("COMMIT")
+        # Give the planner real statistics for the freshly populated tables.
+        conn.execute("ANALYZE")
+
+
+def main():
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+
+    window = BandDatabaseApp()
+    window.resize(1280, 780)
+    window.show()
+
+    sys.exit(app.exec())
+
+if __name__ == "__main__":
+    main()